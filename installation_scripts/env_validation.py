@@ -6,12 +6,16 @@ This module provides validation for environment variables to detect when users
 have copied .env.example without updating placeholder values.
 """
 
+import functools
 import os
 import re
-from typing import NamedTuple
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
 
 
-class ValidationError(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class ValidationError:
     """Represents an environment variable validation error."""
 
     variable: str
@@ -39,18 +43,88 @@ PLACEHOLDER_PATTERNS = {
     "AGENTSPACE_AGENT_ID": ["your-agent-id"],
 }
 
-# Additional pattern-based checks for values that contain placeholders
-PLACEHOLDER_REGEX_PATTERNS = [
-    (r"your-[a-z-]+", "placeholder pattern 'your-...'"),
-    (r"/path/to/", "placeholder path '/path/to/...'"),
-    (r"123456789012", "example project number"),
+# Additional pattern-based checks for values that contain placeholders.
+# Pure literals are checked with plain substring tests (CPython's C-level
+# fast search); only genuinely regex-shaped patterns go through re.
+_LITERAL_SUBSTRINGS = [
+    ("/path/to/", "placeholder path '/path/to/...'"),
+    ("123456789012", "example project number"),
 ]
 
+# Optional: when pyahocorasick is installed, all literal substrings are
+# found in a single left-to-right pass instead of one scan per literal.
+try:
+    import ahocorasick
+
+    _LITERAL_AUTOMATON = ahocorasick.Automaton()
+    for _literal, _description in _LITERAL_SUBSTRINGS:
+        _LITERAL_AUTOMATON.add_word(_literal, _description)
+    _LITERAL_AUTOMATON.make_automaton()
+except ImportError:
+    _LITERAL_AUTOMATON = None
+
+# Non-literal patterns as one compiled alternation; the matched group name
+# keys the description dict, replacing a linear scan over (pattern, text)
+# tuples with a single search plus one hash lookup.
+_PLACEHOLDER_REGEX = re.compile(r"(?P<your>your-[a-z-]+)")
+
+_PLACEHOLDER_REGEX_DESCRIPTIONS = {
+    "your": "placeholder pattern 'your-...'",
+}
+
+# Values shorter than the shortest placeholder token cannot contain any of
+# them, so the substring/regex scans are skipped entirely.
+_MIN_SCAN_LEN = min(len("your-"), *(len(literal) for literal, _ in _LITERAL_SUBSTRINGS))
+
+
+def _build_exact_checkers() -> dict[str, Callable[[str], str | None]]:
+    """Specialize the exact-match check per variable name at import time.
+
+    Each known variable gets a small callable that performs only the
+    comparisons its placeholder list requires: a direct string compare for
+    single-placeholder variables, a dict lookup otherwise.
+    """
+    checkers: dict[str, Callable[[str], str | None]] = {}
+    for var, placeholders in PLACEHOLDER_PATTERNS.items():
+        # Interned placeholders let the == below resolve via CPython's
+        # pointer-identity fast path when the value is interned too.
+        messages = {
+            sys.intern(
+                placeholder
+            ): f"matches .env.example placeholder: '{placeholder}'"
+            for placeholder in placeholders
+        }
+        if len(messages) == 1:
+            ((placeholder, message),) = messages.items()
+            checkers[var] = lambda v, p=placeholder, m=message: m if v == p else None
+        else:
+            checkers[var] = messages.get
+    return checkers
+
+
+_EXACT_CHECKERS = _build_exact_checkers()
+
 
+@functools.lru_cache(maxsize=64)
+def _missing_suggestion(var: str) -> str:
+    return f"Set {var} in your .env file"
+
+
+@functools.lru_cache(maxsize=64)
+def _placeholder_suggestion(var: str) -> str:
+    return f"Replace placeholder value with actual {var}"
+
+
+@functools.lru_cache(maxsize=256)
 def is_placeholder_value(var_name: str, value: str) -> tuple[bool, str | None]:
     """
     Check if a value is a placeholder from .env.example.
 
+    Results are memoized per (var_name, value) pair since long-running
+    processes revalidate the same variables; call
+    ``is_placeholder_value.cache_clear()`` in tests that mutate
+    PLACEHOLDER_PATTERNS.
+
     Args:
         var_name: Name of the environment variable
         value: Current value of the variable
@@ -63,22 +137,43 @@ def is_placeholder_value(var_name: str, value: str) -> tuple[bool, str | None]:
     if not value:
         return False, None
 
+    # Intern short values so exact-match compares hit the identity fast path
+    if len(value) < 128:
+        value = sys.intern(value)
+
     # Check exact matches for known placeholders
-    if var_name in PLACEHOLDER_PATTERNS:
-        for placeholder in PLACEHOLDER_PATTERNS[var_name]:
-            if value == placeholder:
-                return True, f"matches .env.example placeholder: '{placeholder}'"
+    checker = _EXACT_CHECKERS.get(var_name)
+    if checker is not None:
+        exact_message = checker(value)
+        if exact_message is not None:
+            return True, exact_message
+
+    # Too short to contain any placeholder token
+    if len(value) < _MIN_SCAN_LEN:
+        return False, None
 
     # Check if value contains common placeholder patterns
-    for pattern, description in PLACEHOLDER_REGEX_PATTERNS:
-        if re.search(pattern, value):
+    if _LITERAL_AUTOMATON is not None:
+        for _end, description in _LITERAL_AUTOMATON.iter(value):
+            return True, f"contains {description}"
+    else:
+        for literal, description in _LITERAL_SUBSTRINGS:
+            if literal in value:
+                return True, f"contains {description}"
+
+    # Every remaining regex pattern requires the 'your-' token, so a plain
+    # substring test rejects non-placeholders without entering the engine.
+    if "your-" in value:
+        match = _PLACEHOLDER_REGEX.search(value)
+        if match:
+            description = _PLACEHOLDER_REGEX_DESCRIPTIONS[match.lastgroup]
             return True, f"contains {description}"
 
     return False, None
 
 
 def validate_env_vars(
-    required_vars: list[str], env_vars: dict[str, str] | None = None
+    required_vars: list[str], env_vars: Mapping[str, str] | None = None
 ) -> tuple[bool, list[ValidationError]]:
     """
     Validate required environment variables.
@@ -95,7 +190,9 @@ def validate_env_vars(
         - errors: List of ValidationError objects for any issues found
     """
     if env_vars is None:
-        env_vars = dict(os.environ)
+        # os.environ already supports .get(); copying it would materialize
+        # the whole process environment just to read a few names.
+        env_vars = os.environ
 
     errors = []
 
@@ -109,7 +206,7 @@ def validate_env_vars(
                     variable=var,
                     current_value="",
                     error_type="missing",
-                    suggestion=f"Set {var} in your .env file",
+                    suggestion=_missing_suggestion(var),
                 )
             )
             continue
@@ -122,7 +219,7 @@ def validate_env_vars(
                     variable=var,
                     current_value=value,
                     error_type="placeholder",
-                    suggestion=f"Replace placeholder value with actual {var}",
+                    suggestion=_placeholder_suggestion(var),
                 )
             )
 
@@ -147,9 +244,11 @@ def format_validation_errors(errors: list[ValidationError]) -> str:
         "Environment variable validation failed:\n",
     ]
 
-    # Group by error type
-    missing = [e for e in errors if e.error_type == "missing"]
-    placeholders = [e for e in errors if e.error_type == "placeholder"]
+    # Group by error type in a single pass
+    missing: list[ValidationError] = []
+    placeholders: list[ValidationError] = []
+    for error in errors:
+        (missing if error.error_type == "missing" else placeholders).append(error)
 
     if missing:
         lines.append("Missing required variables:")
@@ -202,8 +301,11 @@ def validate_file_path_exists(var_name: str, file_path: str) -> ValidationError
             suggestion=f"Replace with actual path to your {var_name.lower().replace('_', ' ')}",
         )
 
-    # Then check if file exists
-    if not os.path.exists(file_path):
+    # Then check if file exists; os.stat avoids os.path.exists's extra
+    # try/except wrapper and keeps it to a single syscall
+    try:
+        os.stat(file_path)
+    except OSError:
         return ValidationError(
             variable=var_name,
             current_value=file_path,
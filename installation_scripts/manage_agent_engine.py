@@ -7,37 +7,24 @@ listing, testing, and deleting deployed agent engines.
 """
 
 import asyncio
+import filecmp
+import functools
+import hashlib
+import itertools
 import json
 import logging
 import os
 import re
 import sys
+import threading
+import time
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import Annotated
 
 import typer
-import vertexai
 from dotenv import load_dotenv
-from google.api_core import client_options
-from google.cloud import aiplatform
-from google.cloud.aiplatform_v1beta1 import (
-    DeleteReasoningEngineRequest,
-    ListReasoningEnginesRequest,
-    ReasoningEngineServiceClient,
-)
-from vertexai import agent_engines
-from vertexai.preview.reasoning_engines import AdkApp
-
-
-# Import Discovery Engine client for Agent Builder assistants
-try:
-    from google.cloud import discoveryengine_v1 as discoveryengine
-except ImportError:
-    discoveryengine = None
-    logging.warning(
-        "Discovery Engine client library not available. Install with: pip install google-cloud-discoveryengine"
-    )
 
 
 # Import SOC Agent package
@@ -54,14 +41,264 @@ from installation_scripts.env_validation import (
 )
 
 
+# The Vertex AI and Discovery Engine SDKs register hundreds of protobuf
+# descriptors at import time, adding over a second before the CLI can even
+# print --help. They are imported lazily inside the methods that use them.
+
+
+@functools.cache
+def _discoveryengine():
+    """Lazily import the Discovery Engine client library, or None if absent."""
+    try:
+        from google.cloud import discoveryengine_v1
+    except ImportError:
+        logging.warning(
+            "Discovery Engine client library not available. Install with: pip install google-cloud-discoveryengine"
+        )
+        return None
+    return discoveryengine_v1
+
+
+logger = logging.getLogger(__name__)
+
+# Direct-stderr error reporting for the fast-fail argument-validation
+# branches; these only print and exit, so Click's styling machinery (TTY
+# probe, style build, echo indirection) is skipped. Checked once at import.
+_RED = "\x1b[31m"
+_RESET = "\x1b[0m"
+_STDERR_ISATTY = sys.stderr.isatty()
+
+
+def _err(message: str) -> "typer.Exit":
+    """Write a validation error to stderr and return an Exit to raise."""
+    if _STDERR_ISATTY:
+        sys.stderr.write(f"{_RED}{message}{_RESET}\n")
+    else:
+        sys.stderr.write(message + "\n")
+    return typer.Exit(code=1)
+
+
+# Optional: with ijson installed, REST response bodies are decoded
+# incrementally off the socket instead of buffered wholesale before parsing.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: orjson serializes roughly an order of magnitude faster than the
+# stdlib encoder, which matters when dumping multi-megabyte agent specs.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_pretty(data) -> str:
+    """Serialize data to indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
 app = typer.Typer(
     add_completion=False,
+    # Plain help rendering and stock tracebacks keep rich (and its markup
+    # parser) off the startup path of every invocation
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
     help="Manage Agent Engine instances in Vertex AI for the Google MCP Security Agent.",
 )
 
 # Debug mode configuration
 DEBUG = os.environ.get("DEBUG", "False") == "True"
 
+# Listing cost is dominated by per-page round-trips, so default to the
+# server-side maximum page size; tunable for smaller tenants via env var.
+LIST_PAGE_SIZE = int(os.environ.get("AGENT_LIST_PAGE_SIZE", "1000"))
+
+# Absolute cap on results fetched by a single listing command
+MAX_LIST_RESULTS = 50000
+
+# Number of cached gRPC channels to spread concurrent Reasoning Engine
+# requests across; a single channel queues calls once HTTP/2 stream limits
+# are reached
+CLIENT_POOL_SIZE = 4
+
+# Display format for proto timestamps
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Attributes surfaced by agent inspection, in display order
+_INTERESTING_ATTRS = (
+    "resource_name",
+    "display_name",
+    "create_time",
+    "update_time",
+    "state",
+    "spec",
+    "deployment_spec",
+    "service_account",
+)
+
+# Names matching this pattern have their values masked in output; one
+# compiled alternation scan replaces four substring tests per name
+_SENSITIVE_RE = re.compile(r"KEY|SECRET|PASSWORD|TOKEN", re.IGNORECASE)
+
+# OAuth access tokens last 3600 seconds; cache for slightly less so a
+# token is never used right at its expiry boundary
+TOKEN_TTL_SECONDS = 3300
+
+# On-disk cache for REST inspection responses. A short TTL keeps repeated
+# dev-loop inspections off the network without serving stale specs.
+CACHE_DIR = Path.home() / ".cache" / "agent_engine_mgr"
+CACHE_TTL_SECONDS = int(os.environ.get("AGENT_CACHE_TTL", "60"))
+
+
+def _cache_key(*parts: str) -> str:
+    """Deterministic cache key over the identifying request parameters."""
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+def _cache_get(key: str, ttl: int = CACHE_TTL_SECONDS):
+    """Return the cached JSON value for key, or None if absent or stale."""
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - os.stat(path).st_mtime > ttl:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(key: str, value) -> None:
+    """Best-effort write of a JSON value to the on-disk cache.
+
+    Cache files are created owner-only (0600): REST payloads include
+    deployment specs, and even with sensitive values masked upstream the
+    cache should not be world-readable.
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd = os.open(
+            CACHE_DIR / f"{key}.json",
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+            0o600,
+        )
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(value))
+    except (OSError, TypeError):
+        pass
+
+
+def _cache_invalidate(key: str) -> None:
+    """Drop a cache entry; missing entries are not an error."""
+    try:
+        os.unlink(CACHE_DIR / f"{key}.json")
+    except OSError:
+        pass
+
+
+# Default query for the test command
+DEFAULT_TEST_MESSAGE = (
+    "Search RAG Corpus for Malware IRP runbook and get the objective."
+)
+# DEFAULT_TEST_MESSAGE = "List rules with ursnif in the name."
+# DEFAULT_TEST_MESSAGE = "List the first page of soar cases."
+
+# Display names for the known agent modules; unknown modules fall back to
+# "SOC Agent - <module name>"
+AGENT_DISPLAY_NAMES = {
+    "soc_agent": "SOC Agent - Pro",
+    "soc_agent_flash": "SOC Agent - Flash",
+    "soc_agent_tier1": "SOC Agent - Tier 1 Analyst",
+    "soc_agent_cti": "SOC Agent - CTI Researcher",
+}
+
+# Agent modules deployed by default with the create-all command
+DEFAULT_AGENT_MODULES = tuple(AGENT_DISPLAY_NAMES)
+
+# Deployment environment variable table: destination name mapped to
+# (source env var, default). Some destinations intentionally alias the
+# same source because the MCP servers and tests expect different names.
+DEPLOY_ENV_MAP = {
+    "CHRONICLE_PROJECT_ID": ("CHRONICLE_PROJECT_ID", None),
+    "CHRONICLE_CUSTOMER_ID": ("CHRONICLE_CUSTOMER_ID", None),
+    "CHRONICLE_REGION": ("CHRONICLE_REGION", "us"),
+    "GOOGLE_GENAI_USE_VERTEXAI": ("GCP_VERTEXAI_ENABLED", "True"),
+    "LOCATION": ("GCP_LOCATION", None),
+    "GCP_LOCATION": ("GCP_LOCATION", None),  # testing
+    "PROJECT_ID": ("GCP_PROJECT_ID", None),
+    "GCP_PROJECT_ID": ("GCP_PROJECT_ID", None),
+    "RAG_CORPUS": ("RAG_CORPUS_ID", None),
+    "RAG_CORPUS_ID": ("RAG_CORPUS_ID", None),  # testing
+    "SOAR_URL": ("SOAR_URL", None),
+    "SOAR_APP_KEY": ("SOAR_API_KEY", None),
+    "VT_APIKEY": ("GTI_API_KEY", None),
+}
+
+# Requests per minute allowed against the Reasoning Engine API; tuned to
+# stay under the per-project quota so bursts never trigger 429 retry loops
+VERTEX_RPM = int(os.environ.get("VERTEX_RPM", "60"))
+
+
+class TokenBucket:
+    """Token-bucket rate limiter smoothing calls under an RPM quota.
+
+    Refills continuously at rpm/60 tokens per second up to a burst of rpm.
+    acquire() blocks until a token is available, converting bursty request
+    storms (each 429 costs a full retry/backoff cycle) into bounded-wait
+    linear throughput. Shared across worker threads, so state is locked.
+    """
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self.tokens = float(rpm)
+        self.last_update = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until the requested number of tokens is available."""
+        rate = self.rpm / 60.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    float(self.rpm),
+                    self.tokens + (now - self.last_update) * rate,
+                )
+                self.last_update = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / rate
+            time.sleep(wait)
+
+
+# Pattern validates GCP resource name structure for RAG corpora.
+# Supports both numeric and alphanumeric corpus IDs with common separators.
+# This is intentionally permissive to allow for GCP naming flexibility
+# while catching obvious format errors (missing slashes, wrong order).
+RAG_CORPUS_ID_PATTERN = re.compile(
+    r"projects/[^/]+/locations/[^/]+/ragCorpora/[a-zA-Z0-9_-]+"
+)
+
+# Shape of a Reasoning Engine resource name. Validating locally rejects
+# malformed names before any network round-trip is attempted.
+RESOURCE_NAME_PATTERN = re.compile(
+    r"projects/[^/]+/locations/[^/]+/reasoningEngines/\d+"
+)
+
+
+def _check_resource_name(resource_name: str) -> bool:
+    """Report and reject a resource name that cannot possibly be valid."""
+    if RESOURCE_NAME_PATTERN.fullmatch(resource_name):
+        return True
+    typer.secho(f" Invalid resource name: {resource_name}", fg=typer.colors.RED)
+    typer.echo(
+        "Expected format: projects/PROJECT/locations/LOCATION/reasoningEngines/ID"
+    )
+    return False
+
+
 if DEBUG:
     os.environ["GRPC_VERBOSITY"] = "DEBUG"
     os.environ["GRPC_TRACE"] = "all"
@@ -71,9 +308,18 @@ if DEBUG:
     logging.getLogger("google.api_core").setLevel(logging.DEBUG)
 
 
+# Project/location pairs for which the global SDK init already ran in this
+# process; re-running it repeats credential discovery I/O for no effect
+_VERTEX_INITIALIZED: set[tuple[str, str]] = set()
+
+
 class AgentEngineManager:
     """Manages Agent Engine operations in Vertex AI."""
 
+    # Memoized create_agent factories keyed by agent module name; shared
+    # across instances so concurrent deploys skip repeat module resolution
+    _agent_factory_cache: dict[str, Callable] = {}
+
     def __init__(self, env_file: Path):
         """
         Initialize the Agent Engine manager.
@@ -85,14 +331,29 @@ class AgentEngineManager:
         self.env_vars = self._load_env_vars()
         self.project = None
         self.location = None
+        self._credentials = None
+        self._access_token = None
+        self._token_fetched_at = 0.0
+        self._token_lock = threading.Lock()
+        self._remote_app_cache: dict = {}
+        self._bucket = TokenBucket(VERTEX_RPM)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
         self._initialize_vertex_ai()
 
-    def _load_env_vars(self) -> dict[str, str]:
-        """Load environment variables from the .env file."""
-        if self.env_file.exists():
-            load_dotenv(self.env_file, override=True)
-        env_vars = dict(os.environ)
-        return env_vars
+    def _load_env_vars(self) -> Mapping[str, str]:
+        """Load the .env file into the process environment and return it.
+
+        load_dotenv mutates os.environ, so the live mapping is returned
+        directly instead of snapshotting hundreds of inherited entries.
+        """
+        # One stat serves both the existence check and the cache key
+        try:
+            mtime_ns = self.env_file.stat().st_mtime_ns
+        except OSError:
+            return os.environ
+        _load_env(str(self.env_file.resolve()), mtime_ns)
+        return os.environ
 
     def _initialize_vertex_ai(self) -> None:
         """Initialize Vertex AI with project and location from environment."""
@@ -105,9 +366,17 @@ class AgentEngineManager:
             )
             raise typer.Exit(code=1)
 
+        key = (self.project, self.location)
+        if key in _VERTEX_INITIALIZED:
+            return
+
         try:
+            import vertexai
+            from google.cloud import aiplatform
+
             vertexai.init(project=self.project, location=self.location)
             aiplatform.init(project=self.project, location=self.location)
+            _VERTEX_INITIALIZED.add(key)
             typer.secho(
                 f"Initialized Vertex AI - Project: {self.project}, Location: {self.location}",
                 fg=typer.colors.GREEN,
@@ -116,12 +385,232 @@ class AgentEngineManager:
             typer.secho(f" Failed to initialize Vertex AI: {e}", fg=typer.colors.RED)
             raise typer.Exit(code=1)
 
+    def _get_credentials(self):
+        """Return cached application default credentials, refreshing as needed.
+
+        Obtaining ADC walks the metadata server or token endpoint, so the
+        credentials object is cached on the manager and only refreshed in
+        place when its token has expired. This stays entirely in-process; no
+        gcloud subprocess is involved.
+        """
+        from google.auth import default
+        from google.auth.transport import requests as auth_requests
+
+        if self._credentials is None:
+            self._credentials, _ = default(
+                scopes=["https://www.googleapis.com/auth/cloud-platform"]
+            )
+        if not self._credentials.valid:
+            self._credentials.refresh(auth_requests.Request())
+        return self._credentials
+
+    def _get_access_token(self, force_refresh: bool = False) -> str:
+        """Return a cached OAuth access token for REST calls.
+
+        The token is cached for TOKEN_TTL_SECONDS so repeat REST calls skip
+        the refresh round-trip. Pass force_refresh after a 401 to discard a
+        token that was revoked server-side before its expiry.
+        """
+        with self._token_lock:
+            now = time.monotonic()
+            if (
+                force_refresh
+                or self._access_token is None
+                or now - self._token_fetched_at >= TOKEN_TTL_SECONDS
+            ):
+                if force_refresh:
+                    self._credentials = None
+                self._access_token = self._get_credentials().token
+                self._token_fetched_at = now
+            return self._access_token
+
+    @functools.cached_property
+    def _rest_session(self):
+        """Shared HTTP session for REST API calls.
+
+        A pooled session reuses TCP/TLS connections across requests instead
+        of paying a fresh handshake per call, and retries transient gateway
+        errors with backoff.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        )
+        session.mount("https://", adapter)
+        return session
+
+    @staticmethod
+    def _parse_json_response(response) -> dict:
+        """Parse a streamed REST response body into a dict.
+
+        Agent specs with large extra_packages listings can run to megabytes;
+        ijson walks the byte stream as it arrives so the body never has to
+        exist as one contiguous text buffer. Falls back to response.json()
+        when ijson is not installed.
+        """
+        raw = getattr(response, "raw", None)
+        if ijson is not None and raw is not None:
+            raw.decode_content = True
+            return next(ijson.items(raw, "", use_float=True), {})
+        return response.json()
+
+    @functools.cached_property
+    def _httpx_client(self):
+        """Optional HTTP/2 client for REST calls, or None when unavailable.
+
+        HTTP/2 multiplexes concurrent inspection requests over a single TLS
+        connection instead of one connection per in-flight request. Needs
+        httpx installed with the h2 extra; otherwise the pooled requests
+        session is used.
+        """
+        try:
+            import httpx
+
+            return httpx.Client(http2=True, timeout=30)
+        except ImportError:
+            return None
+
+    def _rest_get(self, url: str, headers: dict):
+        """Issue a GET on the HTTP/2 client when available, else the session."""
+        if self._httpx_client is not None:
+            return self._httpx_client.get(url, headers=headers)
+        return self._rest_session.get(url, headers=headers, timeout=30, stream=True)
+
+    def _get_remote_app(self, resource_name: str):
+        """Return the remote app handle for resource_name, cached per name.
+
+        agent_engines.get is an authenticated RPC, and flows like test
+        followed by inspect in the same process otherwise fetch the same
+        handle twice. Entries are dropped when the engine is deleted.
+        """
+        remote_app = self._remote_app_cache.get(resource_name)
+        if remote_app is None:
+            from vertexai import agent_engines
+
+            self._bucket.acquire()
+            remote_app = self._remote_app_cache[resource_name] = agent_engines.get(
+                resource_name
+            )
+        return remote_app
+
+    def _run(self, coro):
+        """Run a coroutine on the manager's persistent event loop.
+
+        asyncio.run builds and tears down a loop per call, discarding any
+        connection pools bound to it; one loop per manager amortizes that
+        across repeated tests in the same process.
+
+        A single loop cannot service two threads at once (run_until_complete
+        raises if the loop is already running), so callers are serialized
+        under a lock; concurrent callers such as the create-all post-deploy
+        tests queue up instead of crashing.
+        """
+        with self._loop_lock:
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                self._loop = loop
+            return loop.run_until_complete(coro)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections and the event loop."""
+        if "_rest_session" in self.__dict__:
+            self._rest_session.close()
+        if self.__dict__.get("_httpx_client") is not None:
+            self._httpx_client.close()
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+
+    @functools.cached_property
+    def _reasoning_engine_client_pool(self):
+        """Round-robin pool of cached Reasoning Engine clients.
+
+        Constructing a client performs a channel setup, TLS handshake, and
+        auth token fetch, so the clients are built once and reused. A small
+        pool rather than a single client keeps concurrent requests from
+        queueing behind one channel's HTTP/2 stream limit.
+        """
+        from google.api_core import client_options
+        from google.cloud.aiplatform_v1beta1 import ReasoningEngineServiceClient
+
+        endpoint = f"{self.location}-aiplatform.googleapis.com"
+        client_opts = client_options.ClientOptions(api_endpoint=endpoint)
+        return itertools.cycle(
+            [
+                ReasoningEngineServiceClient(client_options=client_opts)
+                for _ in range(CLIENT_POOL_SIZE)
+            ]
+        )
+
+    @property
+    def _reasoning_engine_client(self):
+        """Next Reasoning Engine client from the cached pool."""
+        return next(self._reasoning_engine_client_pool)
+
+    @functools.cached_property
+    def _conversational_search_client(self):
+        """Cached Discovery Engine conversational search client."""
+        return _discoveryengine().ConversationalSearchServiceClient()
+
+    @functools.cached_property
+    def _engine_service_client(self):
+        """Cached Discovery Engine engine service client."""
+        return _discoveryengine().EngineServiceClient()
+
+    async def _async_fetch_agent_details(self, resource_names: list[str]) -> dict:
+        """
+        Fetch full agent details for multiple agents concurrently.
+
+        Each agent_engines.get() call is an independent network round-trip, so
+        they are fanned out with asyncio instead of serializing N RPCs. A
+        semaphore caps in-flight requests to stay within API concurrency limits.
+
+        Args:
+            resource_names: Resource names of the agents to fetch
+
+        Returns:
+            Dict mapping resource name to the fetched agent, or to the
+            exception raised while fetching it
+        """
+        semaphore = asyncio.Semaphore(16)
+
+        from vertexai import agent_engines
+
+        def fetch_one(name: str):
+            self._bucket.acquire()
+            return agent_engines.get(name)
+
+        async def fetch(name: str):
+            async with semaphore:
+                try:
+                    return name, await asyncio.to_thread(fetch_one, name)
+                except Exception as e:
+                    return name, e
+
+        results = await asyncio.gather(*(fetch(name) for name in resource_names))
+        return dict(results)
+
     def _format_timestamp(self, timestamp) -> str:
-        """Format timestamp to readable string."""
-        if timestamp:
-            dt = datetime.fromtimestamp(timestamp)
-            return dt.strftime("%Y-%m-%d %H:%M:%S")
-        return "N/A"
+        """Format a timestamp field from a list or get response.
+
+        The SDK surfaces proto Timestamp fields as datetime objects, which
+        format directly; converting through timestamp()/fromtimestamp adds
+        two float conversions per field for nothing. Raw protobuf
+        Timestamps and epoch seconds are still accepted as fallbacks.
+        """
+        if not timestamp:
+            return "N/A"
+        if isinstance(timestamp, datetime):
+            return timestamp.strftime(TIMESTAMP_FORMAT)
+        seconds = getattr(timestamp, "seconds", timestamp)
+        return datetime.fromtimestamp(seconds).strftime(TIMESTAMP_FORMAT)
 
     def list_agents(self, verbose: bool = False) -> list[dict]:
         """
@@ -138,97 +627,149 @@ class AgentEngineManager:
         typer.echo("=" * 80 + "\n")
 
         try:
-            endpoint = f"{self.location}-aiplatform.googleapis.com"
-            client_opts = client_options.ClientOptions(api_endpoint=endpoint)
-            client = ReasoningEngineServiceClient(client_options=client_opts)
+            from google.cloud.aiplatform_v1beta1 import ListReasoningEnginesRequest
+
+            client = self._reasoning_engine_client
 
             parent = f"projects/{self.project}/locations/{self.location}"
 
-            # Use explicit pagination to avoid infinite loops
-            # Set a reasonable page size to prevent excessive API calls
             request = ListReasoningEnginesRequest(
                 parent=parent,
-                page_size=100,  # Reasonable limit per page
-                page_token="",  # Start from first page
+                page_size=LIST_PAGE_SIZE,
             )
 
-            agent_list = []
-            page_count = 0
-            max_pages = 50  # Safety limit to prevent infinite pagination
+            # The generated client returns a pager that lazily fetches pages
+            # and reuses the channel; iterating it replaces the hand-rolled
+            # page_token state machine. islice keeps the absolute result cap.
+            self._bucket.acquire()
+            pager = client.list_reasoning_engines(request=request)
+            limited = itertools.islice(pager, MAX_LIST_RESULTS)
 
-            # Manually iterate through pages with safety limits
-            while True:
-                page_count += 1
-                if page_count > max_pages:
+            agent_details: dict = {}
+            agent_frameworks: dict[str, str] = {}
+            if verbose:
+                # The verbose render needs details prefetched across the
+                # whole listing, so this path materializes it up front.
+                # Derive the agent type from fields already present on the
+                # list response proto where possible; only agents without a
+                # populated spec need the extra agent_engines.get RPC, and
+                # those are fetched concurrently before the render loop.
+                agent_protos = [*limited]
+                if len(agent_protos) == MAX_LIST_RESULTS:
                     typer.secho(
-                        f"\nWarning: Reached maximum page limit ({max_pages}). "
+                        f"\nWarning: Result limit reached ({MAX_LIST_RESULTS}). "
                         "There may be more agents not shown.",
                         fg=typer.colors.YELLOW,
                     )
-                    break
-
-                if DEBUG:
-                    typer.echo(f"Fetching page {page_count}...")
-
-                response = client.list_reasoning_engines(request=request)
-
-                # Add agents from this page
-                for agent in response.reasoning_engines:
-                    agent_list.append(agent)
-
-                # Check if there are more pages
-                if not response.next_page_token:
-                    break
-
-                # Update request for next page
-                request.page_token = response.next_page_token
-
-            if DEBUG:
-                typer.echo(f"Total pages fetched: {page_count}")
-
-            if not agent_list:
-                typer.secho("No Agent Engine instances found.", fg=typer.colors.YELLOW)
-                return []
-
-            typer.echo(
-                f"Found {typer.style(str(len(agent_list)), fg=typer.colors.CYAN)} Agent Engine instance(s):\n"
-            )
-
-            # Build the return list with agent info dictionaries
-            agents_info_list = []
-            for i, agent in enumerate(agent_list, 1):
+                if not agent_protos:
+                    typer.secho(
+                        "No Agent Engine instances found.", fg=typer.colors.YELLOW
+                    )
+                    return []
+                typer.echo(
+                    f"Found {typer.style(str(len(agent_protos)), fg=typer.colors.CYAN)} Agent Engine instance(s):\n"
+                )
+                missing = []
+                for a in agent_protos:
+                    spec = getattr(a, "spec", None)
+                    framework = getattr(spec, "agent_framework", "") if spec else ""
+                    if framework:
+                        agent_frameworks[a.name] = framework
+                    else:
+                        missing.append(a.name)
+                if missing:
+                    agent_details = asyncio.run(
+                        self._async_fetch_agent_details(missing)
+                    )
+                source = agent_protos
+            else:
+                # Stream the non-verbose listing: each agent renders as its
+                # page arrives, so first output appears after one page RTT
+                # instead of after the whole tenant is materialized. (The
+                # protos themselves are still retained via the returned rows
+                # below, so this buys latency, not peak memory.)
+                try:
+                    first = next(limited)
+                except StopIteration:
+                    typer.secho(
+                        "No Agent Engine instances found.", fg=typer.colors.YELLOW
+                    )
+                    return []
+                source = itertools.chain([first], limited)
+
+            # Rows returned to callers are plain dicts of the rendered
+            # fields, plus a reference to the listing proto under "proto" so
+            # inspect-all can re-render an agent without another get RPC
+            agent_rows = []
+            # In verbose mode accumulate the rendered block and write it with
+            # one echo at the end; per-line echo flushes stdout on every
+            # call, which adds up on large tenants. The streaming path echoes
+            # one joined block per agent instead.
+            out: list[str] = []
+            count = 0
+            for i, agent in enumerate(source, 1):
+                count = i
                 agent_info = {
                     "resource_name": agent.name,
                     "display_name": agent.display_name,
                     "create_time": agent.create_time,
                     "update_time": agent.update_time,
                     "state": agent.state.name if hasattr(agent, "state") else "UNKNOWN",
+                    # Raw proto kept so by-index inspection can be served
+                    # from this payload without another get round-trip
+                    "proto": agent,
                 }
-                agents_info_list.append(agent_info)
+                agent_rows.append(agent_info)
 
-                typer.secho(f"{i}. {agent.display_name}", fg=typer.colors.CYAN)
-                typer.echo(f"   Resource: {agent.name}")
-                typer.echo(
-                    f"   Created: {self._format_timestamp(agent.create_time.timestamp() if agent.create_time else None)}"
-                )
-                typer.echo(
-                    f"   Updated: {self._format_timestamp(agent.update_time.timestamp() if agent.update_time else None)}"
-                )
+                block = [
+                    typer.style(f"{i}. {agent.display_name}", fg=typer.colors.CYAN),
+                    f"   Resource: {agent.name}",
+                    f"   Created: {self._format_timestamp(agent.create_time)}",
+                    f"   Updated: {self._format_timestamp(agent.update_time)}",
+                ]
 
                 if verbose:
-                    typer.echo(f"   State: {agent_info['state']}")
-                    try:
-                        full_agent = agent_engines.get(agent.name)
-                        typer.echo(f"   Type: {type(full_agent).__name__}")
-                    except Exception as e:
-                        typer.secho(
-                            f"   Could not fetch additional details: {e}",
-                            fg=typer.colors.YELLOW,
-                        )
+                    out.extend(block)
+                    out.append(f"   State: {agent_info['state']}")
+                    if agent.name in agent_frameworks:
+                        out.append(f"   Type: {agent_frameworks[agent.name]}")
+                    else:
+                        full_agent = agent_details.get(agent.name)
+                        if isinstance(full_agent, Exception):
+                            out.append(
+                                typer.style(
+                                    f"   Could not fetch additional details: {full_agent}",
+                                    fg=typer.colors.YELLOW,
+                                )
+                            )
+                        elif full_agent is not None:
+                            out.append(f"   Type: {type(full_agent).__name__}")
+                    out.append("")
+                else:
+                    block.append("")
+                    typer.echo("\n".join(block))
 
-                typer.echo()
+            if verbose:
+                typer.echo("\n".join(out))
+            else:
+                typer.echo(
+                    f"Found {typer.style(str(count), fg=typer.colors.CYAN)} Agent Engine instance(s)."
+                )
+                if count == MAX_LIST_RESULTS:
+                    typer.secho(
+                        f"\nWarning: Result limit reached ({MAX_LIST_RESULTS}). "
+                        "There may be more agents not shown.",
+                        fg=typer.colors.YELLOW,
+                    )
+
+            # Remember the listing order so an immediate by-index command
+            # can resolve its index without repeating the list RPC
+            _cache_put(
+                _cache_key(self.project, self.location, "names"),
+                [row["resource_name"] for row in agent_rows],
+            )
 
-            return agents_info_list
+            return agent_rows
 
         except Exception as e:
             typer.secho(f" Error listing agents: {e}", fg=typer.colors.RED)
@@ -251,6 +792,7 @@ class AgentEngineManager:
         Returns:
             List of assistant information dictionaries
         """
+        discoveryengine = _discoveryengine()
         if not discoveryengine:
             typer.secho(
                 " Discovery Engine client library not installed.", fg=typer.colors.RED
@@ -269,7 +811,17 @@ class AgentEngineManager:
                     "No engine ID specified. Listing available engines first...",
                     fg=typer.colors.YELLOW,
                 )
-                engines = self.list_engines(collection_id=collection_id)
+
+                # Overlap the engine enumeration RPC with constructing (and
+                # caching) the conversational client the follow-up
+                # list-assistants call will need
+                async def discover():
+                    return await asyncio.gather(
+                        asyncio.to_thread(self.list_engines, collection_id),
+                        asyncio.to_thread(lambda: self._conversational_search_client),
+                    )
+
+                engines, _ = asyncio.run(discover())
                 if not engines:
                     typer.secho(
                         "No engines found. Please create an engine first.",
@@ -281,7 +833,7 @@ class AgentEngineManager:
                 typer.echo("\nAvailable engines:")
                 for i, engine in enumerate(engines, 1):
                     typer.echo(
-                        f"{i}. {engine['name'].split('/')[-1]} - {engine.get('display_name', 'No display name')}"
+                        f"{i}. {engine['name'].rpartition('/')[2]} - {engine.get('display_name', 'No display name')}"
                     )
 
                 # For now, we'll just return and ask user to specify engine_id
@@ -291,8 +843,8 @@ class AgentEngineManager:
                 )
                 return []
 
-            # Create Discovery Engine client
-            client = discoveryengine.ConversationalSearchServiceClient()
+            # Reuse the cached Discovery Engine client
+            client = self._conversational_search_client
 
             # Construct parent path
             parent = f"projects/{self.project}/locations/{self.location}/collections/{collection_id}/engines/{engine_id}"
@@ -302,59 +854,44 @@ class AgentEngineManager:
             # Create request to list assistants
             request = discoveryengine.ListConversationsRequest(
                 parent=parent,
-                page_size=100,  # Reasonable limit per page
+                page_size=LIST_PAGE_SIZE,
             )
 
-            assistant_list = []
-            page_count = 0
-            max_pages = 50  # Safety limit
-
-            # Paginate through results
-            while True:
-                page_count += 1
-                if page_count > max_pages:
-                    typer.secho(
-                        f"\nWarning: Reached maximum page limit ({max_pages}). "
-                        "There may be more assistants not shown.",
-                        fg=typer.colors.YELLOW,
-                    )
-                    break
-
-                if DEBUG:
-                    typer.echo(f"Fetching page {page_count}...")
-
-                # Note: The actual method name might be list_conversations or similar
-                # depending on the Discovery Engine API version
-                try:
-                    response = client.list_conversations(request=request)
-                except AttributeError:
-                    # Try alternative method names
-                    typer.secho(
-                        " API method not found. The Discovery Engine API may have changed.",
-                        fg=typer.colors.RED,
-                    )
-                    return []
-
-                # Add assistants from this page
-                for conversation in response.conversations:
-                    assistant_info = {
-                        "name": conversation.name,
-                        "display_name": getattr(conversation, "display_name", "N/A"),
-                        "state": getattr(conversation, "state", "UNKNOWN"),
-                        "start_time": getattr(conversation, "start_time", None),
-                        "end_time": getattr(conversation, "end_time", None),
-                    }
-                    assistant_list.append(assistant_info)
-
-                # Check if there are more pages
-                if not response.next_page_token:
-                    break
+            # Note: The actual method name might be list_conversations or similar
+            # depending on the Discovery Engine API version
+            try:
+                pager = client.list_conversations(request=request)
+            except AttributeError:
+                # Try alternative method names
+                typer.secho(
+                    " API method not found. The Discovery Engine API may have changed.",
+                    fg=typer.colors.RED,
+                )
+                return []
 
-                # Update request for next page
-                request.page_token = response.next_page_token
+            # Iterate the pager directly; it fetches pages lazily up to the
+            # absolute result cap. Proto-plus messages always expose their
+            # fields (zero-valued when unset), so direct attribute access
+            # replaces the slower getattr-with-default calls. Building the
+            # rows in one comprehension also sizes the list in a single
+            # C-level pass instead of interpreter-growth appends.
+            assistant_list = [
+                {
+                    "name": conversation.name,
+                    "display_name": conversation.display_name or "N/A",
+                    "state": conversation.state or "UNKNOWN",
+                    "start_time": conversation.start_time,
+                    "end_time": conversation.end_time,
+                }
+                for conversation in itertools.islice(pager, MAX_LIST_RESULTS)
+            ]
 
-            if DEBUG:
-                typer.echo(f"Total pages fetched: {page_count}")
+            if len(assistant_list) == MAX_LIST_RESULTS:
+                typer.secho(
+                    f"\nWarning: Result limit reached ({MAX_LIST_RESULTS}). "
+                    "There may be more assistants not shown.",
+                    fg=typer.colors.YELLOW,
+                )
 
             if not assistant_list:
                 typer.secho(
@@ -384,10 +921,9 @@ class AgentEngineManager:
 
         except Exception as e:
             typer.secho(f" Error listing assistants: {e}", fg=typer.colors.RED)
-            if DEBUG:
-                import traceback
-
-                typer.echo(traceback.format_exc())
+            # Lazy %-style args: the record is only formatted when the
+            # debug level is actually enabled
+            logger.debug("Error listing assistants: %s", e, exc_info=True)
             return []
 
     def list_engines(self, collection_id: str = "default_collection") -> list[dict]:
@@ -400,6 +936,7 @@ class AgentEngineManager:
         Returns:
             List of engine information dictionaries
         """
+        discoveryengine = _discoveryengine()
         if not discoveryengine:
             typer.secho(
                 " Discovery Engine client library not installed.", fg=typer.colors.RED
@@ -407,8 +944,8 @@ class AgentEngineManager:
             return []
 
         try:
-            # Create Discovery Engine client for engines
-            client = discoveryengine.EngineServiceClient()
+            # Reuse the cached Discovery Engine client for engines
+            client = self._engine_service_client
 
             # Construct parent path for engines
             parent = f"projects/{self.project}/locations/{self.location}/collections/{collection_id}"
@@ -416,7 +953,7 @@ class AgentEngineManager:
             # Create request to list engines
             request = discoveryengine.ListEnginesRequest(
                 parent=parent,
-                page_size=100,
+                page_size=LIST_PAGE_SIZE,
             )
 
             engines_list = []
@@ -436,8 +973,7 @@ class AgentEngineManager:
             return engines_list
 
         except Exception as e:
-            if DEBUG:
-                typer.secho(f" Error listing engines: {e}", fg=typer.colors.RED)
+            logger.debug("Error listing engines: %s", e, exc_info=True)
             return []
 
     def delete_agent(self, resource_name: str, force: bool = False) -> bool:
@@ -451,24 +987,26 @@ class AgentEngineManager:
         Returns:
             True if successful, False otherwise
         """
+        if not _check_resource_name(resource_name):
+            return False
+
         typer.echo("\n" + "=" * 80)
         typer.secho("Deleting Agent Engine Instance", fg=typer.colors.RED, bold=True)
         typer.echo("=" * 80 + "\n")
 
         try:
-            endpoint = f"{self.location}-aiplatform.googleapis.com"
-            client_opts = client_options.ClientOptions(api_endpoint=endpoint)
-            client = ReasoningEngineServiceClient(client_options=client_opts)
+            from google.cloud.aiplatform_v1beta1 import DeleteReasoningEngineRequest
+
+            client = self._reasoning_engine_client
 
             typer.echo(f"Fetching agent: {resource_name}")
+            self._bucket.acquire()
             agent = client.get_reasoning_engine(name=resource_name)
 
             typer.secho("\nAgent Details:", fg=typer.colors.YELLOW)
             typer.echo(f"  Name: {agent.display_name}")
             typer.echo(f"  Resource: {agent.name}")
-            typer.echo(
-                f"  Created: {self._format_timestamp(agent.create_time.timestamp() if agent.create_time else None)}"
-            )
+            typer.echo(f"  Created: {self._format_timestamp(agent.create_time)}")
 
             if not force:
                 if not typer.confirm(
@@ -479,10 +1017,16 @@ class AgentEngineManager:
                     return False
 
             typer.secho("\nDeleting agent...", fg=typer.colors.YELLOW)
+            self._bucket.acquire()
             request = DeleteReasoningEngineRequest(
                 name=resource_name, force=True  # Delete child resources too
             )
             client.delete_reasoning_engine(request=request)
+            # The deleted engine's cached REST payload, handle, and the
+            # cached listing order are all stale
+            _cache_invalidate(_cache_key(self.project, self.location, resource_name))
+            _cache_invalidate(_cache_key(self.project, self.location, "names"))
+            self._remote_app_cache.pop(resource_name, None)
             typer.secho("Agent deleted successfully!", fg=typer.colors.GREEN)
             return True
 
@@ -490,6 +1034,63 @@ class AgentEngineManager:
             typer.secho(f" Error deleting agent: {e}", fg=typer.colors.RED)
             return False
 
+    def _iter_agents(self):
+        """Yield listing protos lazily, one page at a time.
+
+        By-index lookups only need the first N results; iterating the pager
+        directly stops fetching pages as soon as the caller stops consuming,
+        instead of materializing and rendering the whole tenant.
+        """
+        from google.cloud.aiplatform_v1beta1 import ListReasoningEnginesRequest
+
+        client = self._reasoning_engine_client
+        parent = f"projects/{self.project}/locations/{self.location}"
+        request = ListReasoningEnginesRequest(parent=parent, page_size=LIST_PAGE_SIZE)
+        self._bucket.acquire()
+        yield from itertools.islice(
+            client.list_reasoning_engines(request=request), MAX_LIST_RESULTS
+        )
+
+    def _resource_at_index(self, index: int) -> str | None:
+        """Resolve an index against the cached listing order, if still fresh.
+
+        The cache is written by list_agents and dropped on create/delete, so
+        a hit reproduces exactly the numbering the user just saw.
+        """
+        names = _cache_get(_cache_key(self.project, self.location, "names"))
+        if names and 1 <= index <= len(names):
+            return names[index - 1]
+        return None
+
+    def _agent_at_index(self, index: int):
+        """
+        Return the listing proto at the 1-based index, or None.
+
+        Args:
+            index: Index of the agent in the list (1-based)
+
+        Returns:
+            The listing proto, or None if the index is out of range
+        """
+        if index < 1:
+            typer.secho(" Invalid index. Indexes start at 1.", fg=typer.colors.RED)
+            return None
+        try:
+            fetched = [*itertools.islice(self._iter_agents(), index)]
+        except Exception as e:
+            typer.secho(f" Error listing agents: {e}", fg=typer.colors.RED)
+            return None
+        # The index >= 1 guard above makes negative indexing impossible, so
+        # the subscript itself is the bounds check on the success path
+        try:
+            return fetched[index - 1]
+        except IndexError:
+            typer.secho(
+                f" Invalid index. Only {len(fetched)} agent(s) found.",
+                fg=typer.colors.RED,
+            )
+            return None
+
     def delete_agent_by_index(self, index: int, force: bool = False) -> bool:
         """
         Delete an agent by its index in the list.
@@ -501,137 +1102,231 @@ class AgentEngineManager:
         Returns:
             True if successful, False otherwise
         """
-        agents = self.list_agents(verbose=False)
-
-        if not agents:
-            return False
-
-        if index < 1 or index > len(agents):
-            typer.secho(
-                f" Invalid index. Please choose between 1 and {len(agents)}",
-                fg=typer.colors.RED,
-            )
+        # Deliberately skip the cached names list used by the read-only
+        # commands: it can be up to CACHE_TTL_SECONDS stale (and written by
+        # another process), and a stale index on a forced delete would
+        # silently remove the wrong engine. Always resolve from a fresh
+        # listing before deleting.
+        proto = self._agent_at_index(index)
+        if proto is None:
             return False
+        return self.delete_agent(proto.name, force)
 
-        agent = agents[index - 1]
-        return self.delete_agent(agent["resource_name"], force)
-
-    def create_agent(
-        self,
-        agent_module: str = "soc_agent",
-        debug: bool = False,
-        no_test: bool = False,
-    ) -> str | None:
+    def delete_agents_by_indices(self, indices: list[int], force: bool = False) -> bool:
         """
-        Create and deploy a new Agent Engine instance.
+        Delete several agents by their 1-based listing indices.
+
+        One listing pass resolves every index, then the delete RPCs are
+        fanned out concurrently, so deleting N engines costs one listing
+        plus roughly one round-trip batch instead of N of each.
 
         Args:
-            agent_module: Name of the agent module to import (default: "soc_agent")
-            debug: Enable debug mode with verbose logging
-            no_test: Skip the automatic test after creation
+            indices: Indices of the agents in the list (1-based)
+            force: Skip confirmation prompt
 
         Returns:
-            Resource name of the created agent if successful, None otherwise
+            True if every requested agent was deleted, False otherwise
         """
+        if not indices:
+            return False
+        unique = sorted(set(indices))
+        if unique[0] < 1:
+            typer.secho(" Invalid index. Indexes start at 1.", fg=typer.colors.RED)
+            return False
+        try:
+            fetched = [*itertools.islice(self._iter_agents(), unique[-1])]
+        except Exception as e:
+            typer.secho(f" Error listing agents: {e}", fg=typer.colors.RED)
+            return False
+        if len(fetched) < unique[-1]:
+            typer.secho(
+                f" Invalid index. Only {len(fetched)} agent(s) found.",
+                fg=typer.colors.RED,
+            )
+            return False
+
+        targets = [fetched[i - 1] for i in unique]
+
         typer.echo("\n" + "=" * 80)
-        typer.secho("Creating Agent Engine Instance", fg=typer.colors.BLUE, bold=True)
+        typer.secho("Deleting Agent Engine Instances", fg=typer.colors.RED, bold=True)
         typer.echo("=" * 80 + "\n")
+        for proto in targets:
+            typer.echo(f"  {proto.display_name}: {proto.name}")
 
-        typer.echo(f"Agent module: {agent_module}")
+        if not force:
+            if not typer.confirm(
+                f"\nAre you sure you want to delete these {len(targets)} agent(s)?",
+                default=False,
+            ):
+                typer.secho("Deletion cancelled.", fg=typer.colors.YELLOW)
+                return False
 
-        # Set debug mode
-        if debug:
-            os.environ["DEBUG"] = "True"
-            os.environ["GRPC_VERBOSITY"] = "DEBUG"
-            os.environ["GRPC_TRACE"] = "all"
-            logging.basicConfig(level=logging.DEBUG)
-            logging.getLogger("google").setLevel(logging.DEBUG)
-            logging.getLogger("google.auth").setLevel(logging.DEBUG)
-            logging.getLogger("google.api_core").setLevel(logging.DEBUG)
+        from google.cloud.aiplatform_v1beta1 import DeleteReasoningEngineRequest
 
-        try:
-            # Load environment variables
-            typer.echo("Loading environment configuration...")
-            load_dotenv(self.env_file, override=True)
-
-            # Validate required environment variables
-            required_vars = [
-                "GCP_PROJECT_ID",
-                "GCP_LOCATION",
-                "GCP_STAGING_BUCKET",
-                "CHRONICLE_PROJECT_ID",
-                "CHRONICLE_CUSTOMER_ID",
-                "CHRONICLE_SERVICE_ACCOUNT_PATH",
-                "SOAR_URL",
-                "SOAR_API_KEY",
-                "GTI_API_KEY",
-                "RAG_CORPUS_ID",
-            ]
+        client = self._reasoning_engine_client
 
-            # Check for missing or placeholder values
-            is_valid, errors = validate_env_vars(required_vars)
-            if not is_valid:
-                typer.secho(" Configuration Error", fg=typer.colors.RED, bold=True)
-                typer.echo()
-                typer.echo(format_validation_errors(errors))
-                return None
+        def delete_one(name: str) -> None:
+            self._bucket.acquire()
+            client.delete_reasoning_engine(
+                request=DeleteReasoningEngineRequest(name=name, force=True)
+            )
 
-            # Validate RAG_CORPUS_ID format
-            # Pattern validates GCP resource name structure for RAG corpora.
-            # Supports both numeric and alphanumeric corpus IDs with common separators.
-            # This is intentionally permissive to allow for GCP naming flexibility
-            # while catching obvious format errors (missing slashes, wrong order).
-            rag_corpus_id = os.environ.get("RAG_CORPUS_ID", "")
-            rag_pattern = r"^projects/[^/]+/locations/[^/]+/ragCorpora/[a-zA-Z0-9_-]+$"
-            if not re.match(rag_pattern, rag_corpus_id):
-                typer.secho(
-                    f" Invalid RAG_CORPUS_ID format: {rag_corpus_id}",
-                    fg=typer.colors.RED,
-                )
-                typer.secho(
-                    "  Expected format: projects/PROJECT_ID/locations/LOCATION/ragCorpora/CORPUS_ID",
-                    fg=typer.colors.YELLOW,
-                )
-                return None
+        async def delete_all():
+            semaphore = asyncio.Semaphore(4)
 
-            # Initialize Vertex AI
-            typer.echo("Initializing Vertex AI...")
-            GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID")
-            GCP_LOCATION = os.environ.get("GCP_LOCATION", "us-central1")
-            GCP_STAGING_BUCKET = os.environ.get("GCP_STAGING_BUCKET")
+            async def run(name: str):
+                async with semaphore:
+                    try:
+                        await asyncio.to_thread(delete_one, name)
+                        return name, None
+                    except Exception as e:
+                        return name, e
+
+            return await asyncio.gather(*(run(p.name) for p in targets))
 
-            vertexai.init(
-                project=GCP_PROJECT_ID,
-                location=GCP_LOCATION,
-                staging_bucket=GCP_STAGING_BUCKET,
+        typer.secho("\nDeleting agents...", fg=typer.colors.YELLOW)
+        results = asyncio.run(delete_all())
+
+        success = True
+        _cache_invalidate(_cache_key(self.project, self.location, "names"))
+        for name, error in results:
+            if error is None:
+                _cache_invalidate(_cache_key(self.project, self.location, name))
+                self._remote_app_cache.pop(name, None)
+                typer.secho(f"Deleted: {name}", fg=typer.colors.GREEN)
+            else:
+                typer.secho(f" Error deleting {name}: {error}", fg=typer.colors.RED)
+                success = False
+        return success
+
+    def _prepare_deployment(self) -> bool:
+        """
+        Validate configuration and initialize Vertex AI for deployment.
+
+        This is the module-independent half of a deploy: load the environment,
+        validate required variables, initialize Vertex AI with the staging
+        bucket, and stage the Chronicle service account file for the MCP
+        server. Run it once before deploying one or many agent modules.
+
+        Returns:
+            True when the environment is ready for deployment, False if a
+            configuration error was reported
+        """
+        # The constructor already loaded the .env file into os.environ, so
+        # deployment prep validates without re-reading and re-parsing it
+        typer.echo("Loading environment configuration...")
+
+        # Validate required environment variables
+        required_vars = [
+            "GCP_PROJECT_ID",
+            "GCP_LOCATION",
+            "GCP_STAGING_BUCKET",
+            "CHRONICLE_PROJECT_ID",
+            "CHRONICLE_CUSTOMER_ID",
+            "CHRONICLE_SERVICE_ACCOUNT_PATH",
+            "SOAR_URL",
+            "SOAR_API_KEY",
+            "GTI_API_KEY",
+            "RAG_CORPUS_ID",
+        ]
+
+        # Check for missing or placeholder values
+        is_valid, errors = validate_env_vars(required_vars)
+        if not is_valid:
+            typer.secho(" Configuration Error", fg=typer.colors.RED, bold=True)
+            typer.echo()
+            typer.echo(format_validation_errors(errors))
+            return False
+
+        # Validate RAG_CORPUS_ID format
+        rag_corpus_id = os.environ.get("RAG_CORPUS_ID", "")
+        if not RAG_CORPUS_ID_PATTERN.fullmatch(rag_corpus_id):
+            typer.secho(
+                f" Invalid RAG_CORPUS_ID format: {rag_corpus_id}",
+                fg=typer.colors.RED,
+            )
+            typer.secho(
+                "  Expected format: projects/PROJECT_ID/locations/LOCATION/ragCorpora/CORPUS_ID",
+                fg=typer.colors.YELLOW,
             )
+            return False
+
+        # Initialize Vertex AI
+        typer.echo("Initializing Vertex AI...")
+        import vertexai
 
-            # Copy service account file to where MCP server expects it
-            CHRONICLE_SERVICE_ACCOUNT_PATH = os.environ.get(
-                "CHRONICLE_SERVICE_ACCOUNT_PATH"
+        GCP_PROJECT_ID = os.environ.get("GCP_PROJECT_ID")
+        GCP_LOCATION = os.environ.get("GCP_LOCATION", "us-central1")
+        GCP_STAGING_BUCKET = os.environ.get("GCP_STAGING_BUCKET")
+
+        vertexai.init(
+            project=GCP_PROJECT_ID,
+            location=GCP_LOCATION,
+            staging_bucket=GCP_STAGING_BUCKET,
+        )
+
+        # Copy service account file to where MCP server expects it
+        CHRONICLE_SERVICE_ACCOUNT_PATH = os.environ.get(
+            "CHRONICLE_SERVICE_ACCOUNT_PATH"
+        )
+        if CHRONICLE_SERVICE_ACCOUNT_PATH:
+            # Validate the service account file path exists and is not a placeholder
+            file_error = validate_file_path_exists(
+                "CHRONICLE_SERVICE_ACCOUNT_PATH", CHRONICLE_SERVICE_ACCOUNT_PATH
             )
-            if CHRONICLE_SERVICE_ACCOUNT_PATH:
-                # Validate the service account file path exists and is not a placeholder
-                file_error = validate_file_path_exists(
-                    "CHRONICLE_SERVICE_ACCOUNT_PATH", CHRONICLE_SERVICE_ACCOUNT_PATH
+            if file_error:
+                typer.secho(" Configuration Error", fg=typer.colors.RED, bold=True)
+                typer.echo()
+                typer.echo(format_validation_errors([file_error]))
+                return False
+
+            dest_dir = Path("./mcp-security/server/secops/secops_mcp/")
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            src_path = Path(CHRONICLE_SERVICE_ACCOUNT_PATH)
+            dest_path = dest_dir / src_path.name
+            if dest_path.exists() and filecmp.cmp(src_path, dest_path, shallow=True):
+                # Unchanged since the last deploy; nothing to stage
+                typer.echo(
+                    "Service account file already staged for Chronicle MCP server"
                 )
-                if file_error:
-                    typer.secho(" Configuration Error", fg=typer.colors.RED, bold=True)
-                    typer.echo()
-                    typer.echo(format_validation_errors([file_error]))
-                    return None
-
-                dest_dir = Path("./mcp-security/server/secops/secops_mcp/")
-                dest_dir.mkdir(parents=True, exist_ok=True)
-                shutil.copy(CHRONICLE_SERVICE_ACCOUNT_PATH, dest_dir)
-                typer.echo("Copied service account file for Chronicle MCP server")
             else:
-                raise ValueError("CHRONICLE_SERVICE_ACCOUNT_PATH is not set")
+                try:
+                    # Zero-copy hardlink when source and destination share a
+                    # filesystem; falls back to a regular copy otherwise
+                    dest_path.unlink(missing_ok=True)
+                    os.link(src_path, dest_path)
+                except OSError:
+                    shutil.copy(src_path, dest_path)
+                typer.echo("Staged service account file for Chronicle MCP server")
+        else:
+            raise ValueError("CHRONICLE_SERVICE_ACCOUNT_PATH is not set")
+
+        return True
 
-            # Dynamically import and create the agent from the specified module
-            typer.echo(f"Importing agent from {agent_module}...")
+    def _deploy_one(self, agent_module: str, no_test: bool = False) -> str | None:
+        """
+        Import, build, and deploy a single agent module.
+
+        Assumes _prepare_deployment has already validated the environment and
+        initialized Vertex AI.
+
+        Args:
+            agent_module: Name of the agent module to import
+            no_test: Skip the automatic test after creation
+
+        Returns:
+            Resource name of the created agent if successful, None otherwise
+        """
+        # Dynamically import and create the agent from the specified module.
+        # An already-imported module is taken straight from sys.modules, which
+        # skips the import machinery on repeat deploys in the same process.
+        typer.echo(f"Importing agent from {agent_module}...")
+        create_agent_func = self._agent_factory_cache.get(agent_module)
+        if create_agent_func is None:
             try:
-                agent_pkg = importlib.import_module(agent_module)
+                agent_pkg = sys.modules.get(agent_module) or importlib.import_module(
+                    agent_module
+                )
                 create_agent_func = agent_pkg.create_agent
             except ImportError as e:
                 typer.secho(
@@ -645,80 +1340,104 @@ class AgentEngineManager:
                     fg=typer.colors.RED,
                 )
                 return None
+            self._agent_factory_cache[agent_module] = create_agent_func
 
-            typer.echo("Creating agent...")
-            agent = create_agent_func()
+        typer.echo("Creating agent...")
+        agent = create_agent_func()
 
-            # Create the ADK app
-            typer.echo("Creating ADK app...")
-            app = AdkApp(
-                agent=agent,
-                enable_tracing=True,
-            )
+        # Create the ADK app
+        typer.echo("Creating ADK app...")
+        from vertexai.preview.reasoning_engines import AdkApp
 
-            # Get environment variables for deployment
-            env_vars = {
-                "CHRONICLE_PROJECT_ID": os.environ.get("CHRONICLE_PROJECT_ID"),
-                "CHRONICLE_CUSTOMER_ID": os.environ.get("CHRONICLE_CUSTOMER_ID"),
-                "CHRONICLE_REGION": os.environ.get("CHRONICLE_REGION", "us"),
-                "GOOGLE_GENAI_USE_VERTEXAI": os.environ.get(
-                    "GCP_VERTEXAI_ENABLED", "True"
-                ),
-                "LOCATION": os.environ.get("GCP_LOCATION"),
-                "GCP_LOCATION": os.environ.get("GCP_LOCATION"),  # testing
-                "PROJECT_ID": os.environ.get("GCP_PROJECT_ID"),
-                "GCP_PROJECT_ID": os.environ.get("GCP_PROJECT_ID"),
-                "RAG_CORPUS": os.environ.get("RAG_CORPUS_ID"),
-                "RAG_CORPUS_ID": os.environ.get("RAG_CORPUS_ID"),  # testing
-                "SOAR_URL": os.environ.get("SOAR_URL"),
-                "SOAR_APP_KEY": os.environ.get("SOAR_API_KEY"),
-                "VT_APIKEY": os.environ.get("GTI_API_KEY"),
-            }
-
-            # Determine display name based on agent module
-            if agent_module == "soc_agent_flash":
-                display_name = "SOC Agent - Flash"
-            elif agent_module == "soc_agent":
-                display_name = "SOC Agent - Pro"
-            elif agent_module == "soc_agent_tier1":
-                display_name = "SOC Agent - Tier 1 Analyst"
-            elif agent_module == "soc_agent_cti":
-                display_name = "SOC Agent - CTI Researcher"
-            else:
-                # For any future agent modules, use the module name as-is
-                display_name = f"SOC Agent - {agent_module}"
-
-            # Deploy the agent engine
-            typer.echo(f"Deploying agent engine to Vertex AI as '{display_name}'...")
-            remote_app = agent_engines.create(
-                app,
-                display_name=display_name,
-                requirements=[
-                    "cloudpickle",
-                    "google-adk~=1.18.0",
-                    "google-cloud-aiplatform[agent-engines]~=1.127.0",
-                    "pydantic",
-                    "python-dotenv",
-                ],
-                build_options={
-                    "installation_scripts": ["installation_scripts/install.sh"]
-                },
-                extra_packages=[
-                    "mcp-security/server",
-                    "installation_scripts/install.sh",  # installs uvx
-                ],
-                env_vars=env_vars,
-            )
+        app = AdkApp(
+            agent=agent,
+            enable_tracing=True,
+        )
+
+        # Get environment variables for deployment from the declarative table
+        env = os.environ
+        env_vars = {
+            dest: env.get(source, default)
+            for dest, (source, default) in DEPLOY_ENV_MAP.items()
+        }
 
-            typer.secho("\n Agent deployed successfully!", fg=typer.colors.GREEN)
-            typer.echo(f"Resource name: {remote_app.resource_name}")
+        # Determine display name based on agent module
+        display_name = AGENT_DISPLAY_NAMES.get(
+            agent_module, f"SOC Agent - {agent_module}"
+        )
 
-            # Optionally run test
-            if not no_test:
-                typer.echo("\nRunning test...")
-                self.test_agent_with_resource(remote_app.resource_name)
+        # Deploy the agent engine
+        from vertexai import agent_engines
+
+        typer.echo(f"Deploying agent engine to Vertex AI as '{display_name}'...")
+        remote_app = agent_engines.create(
+            app,
+            display_name=display_name,
+            requirements=[
+                "cloudpickle",
+                "google-adk~=1.18.0",
+                "google-cloud-aiplatform[agent-engines]~=1.127.0",
+                "pydantic",
+                "python-dotenv",
+            ],
+            build_options={"installation_scripts": ["installation_scripts/install.sh"]},
+            extra_packages=[
+                "mcp-security/server",
+                "installation_scripts/install.sh",  # installs uvx
+            ],
+            env_vars=env_vars,
+        )
 
-            return remote_app.resource_name
+        typer.secho("\n Agent deployed successfully!", fg=typer.colors.GREEN)
+        typer.echo(f"Resource name: {remote_app.resource_name}")
+
+        # The cached listing order no longer reflects the tenant
+        _cache_invalidate(_cache_key(self.project, self.location, "names"))
+
+        # Optionally run test
+        if not no_test:
+            typer.echo("\nRunning test...")
+            self.test_agent_with_resource(remote_app.resource_name)
+
+        return remote_app.resource_name
+
+    def create_agent(
+        self,
+        agent_module: str = "soc_agent",
+        debug: bool = False,
+        no_test: bool = False,
+    ) -> str | None:
+        """
+        Create and deploy a new Agent Engine instance.
+
+        Args:
+            agent_module: Name of the agent module to import (default: "soc_agent")
+            debug: Enable debug mode with verbose logging
+            no_test: Skip the automatic test after creation
+
+        Returns:
+            Resource name of the created agent if successful, None otherwise
+        """
+        typer.echo("\n" + "=" * 80)
+        typer.secho("Creating Agent Engine Instance", fg=typer.colors.BLUE, bold=True)
+        typer.echo("=" * 80 + "\n")
+
+        typer.echo(f"Agent module: {agent_module}")
+
+        # Set debug mode
+        if debug:
+            os.environ["DEBUG"] = "True"
+            os.environ["GRPC_VERBOSITY"] = "DEBUG"
+            os.environ["GRPC_TRACE"] = "all"
+            logging.basicConfig(level=logging.DEBUG)
+            logging.getLogger("google").setLevel(logging.DEBUG)
+            logging.getLogger("google.auth").setLevel(logging.DEBUG)
+            logging.getLogger("google.api_core").setLevel(logging.DEBUG)
+
+        try:
+            if not self._prepare_deployment():
+                return None
+            return self._deploy_one(agent_module, no_test)
 
         except Exception as e:
             typer.secho(f" Error creating agent: {e}", fg=typer.colors.RED)
@@ -727,112 +1446,199 @@ class AgentEngineManager:
             typer.echo(traceback.format_exc())
             return None
 
-    def test_agent_with_resource(self, resource_name: str) -> bool:
+    async def create_agents_batch(
+        self, agent_modules: list[str], no_test: bool = False
+    ) -> list[str | None]:
+        """
+        Deploy several agent modules concurrently.
+
+        Each agent_engines.create call is a long blocking RPC (minutes), so
+        independent module deploys are overlapped in worker threads instead of
+        serializing. Environment validation and Vertex AI initialization run
+        once up front.
+
+        Args:
+            agent_modules: Names of the agent modules to deploy
+            no_test: Skip the automatic test after each creation
+
+        Returns:
+            Resource names in the same order as agent_modules, with None for
+            deploys that failed
+        """
+        typer.echo("\n" + "=" * 80)
+        typer.secho("Creating Agent Engine Instances", fg=typer.colors.BLUE, bold=True)
+        typer.echo("=" * 80 + "\n")
+
+        typer.echo(f"Agent modules: {', '.join(agent_modules)}")
+
+        if not self._prepare_deployment():
+            return [None] * len(agent_modules)
+
+        async def deploy(module: str) -> str | None:
+            try:
+                return await asyncio.to_thread(self._deploy_one, module, no_test)
+            except Exception as e:
+                typer.secho(f" Error deploying '{module}': {e}", fg=typer.colors.RED)
+                return None
+
+        return list(await asyncio.gather(*(deploy(m) for m in agent_modules)))
+
+    def test_agent_with_resource(
+        self, resource_name: str, messages: list[str] | None = None
+    ) -> bool:
         """
-        Test a deployed agent engine with a sample query.
+        Test a deployed agent engine with one or more sample queries.
 
         Args:
             resource_name: Resource name of the agent to test
+            messages: Queries to send concurrently (defaults to the sample)
 
         Returns:
             True if test successful, False otherwise
         """
+        if not _check_resource_name(resource_name):
+            return False
+
         try:
             typer.echo("\n" + "=" * 80)
             typer.secho("Testing Agent Engine", fg=typer.colors.CYAN, bold=True)
             typer.echo("=" * 80 + "\n")
 
-            # Get the agent
-            remote_app = agent_engines.get(resource_name)
+            # Get the agent, reusing a cached handle when this process has
+            # already fetched it
+            remote_app = self._get_remote_app(resource_name)
 
-            # Run async test
-            asyncio.run(self._async_test_agent(remote_app))
+            # Run async test on the persistent loop
+            self._run(self._async_test_agent(remote_app, messages))
             return True
 
         except Exception as e:
             typer.secho(f" Error testing agent: {e}", fg=typer.colors.RED)
             return False
 
-    async def _async_test_agent(self, remote_app):
-        """Async test function for agent engine."""
+    async def _async_test_agent(
+        self, remote_app, messages: list[str] | None = None
+    ) -> None:
+        """Async test function for agent engine.
+
+        All queries share one session and stream concurrently; the workload
+        is pure network wait, so N queries overlap into roughly one
+        round-trip instead of running back to back.
+        """
         user_id = "test_user"
         session = await remote_app.async_create_session(user_id=user_id)
-        typer.echo(f"Created session: {session.get('id')}")
-
-        events = []
-        test_message = (
-            "Search RAG Corpus for Malware IRP runbook and get the objective."
-        )
-        # test_message = "List rules with ursnif in the name."
-        # test_message = "List the first page of soar cases."
-
-        typer.echo(f"Sending test query: {test_message}")
-        async for event in remote_app.async_stream_query(
-            user_id=user_id, session_id=session.get("id"), message=test_message
-        ):
-            typer.echo(f"Event: {event}")
-            events.append(event)
+        session_id = session.get("id")
+        typer.echo(f"Created session: {session_id}")
+
+        if not messages:
+            messages = [DEFAULT_TEST_MESSAGE]
+
+        # Events are echoed as they stream, so only a count is retained;
+        # holding every event in a list grows without bound on long runs
+        event_count = 0
+        for message in messages:
+            typer.echo(f"Sending test query: {message}")
+
+        # Decouple receiving from printing: a blocking echo per event would
+        # backpressure the gRPC streams, so the readers feed a bounded queue
+        # and the writer drains it in batches with one echo per batch
+        queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+
+        async def read_events(message: str) -> None:
+            async for event in remote_app.async_stream_query(
+                user_id=user_id, session_id=session_id, message=message
+            ):
+                await queue.put(event)
+
+        async def read_all() -> None:
+            try:
+                await asyncio.gather(*(read_events(m) for m in messages))
+            finally:
+                await queue.put(None)
 
-        if not events:
+        async def print_events() -> None:
+            nonlocal event_count
+            while True:
+                event = await queue.get()
+                if event is None:
+                    return
+                event_count += 1
+                batch = [f"Event: {event}"]
+                while len(batch) < 16 and not queue.empty():
+                    event = queue.get_nowait()
+                    if event is None:
+                        typer.echo("\n".join(batch))
+                        return
+                    event_count += 1
+                    batch.append(f"Event: {event}")
+                typer.echo("\n".join(batch))
+
+        await asyncio.gather(read_all(), print_events())
+
+        if not event_count:
             typer.secho(" No events received from agent!", fg=typer.colors.YELLOW)
         else:
             typer.secho(
-                f" Test completed successfully - received {len(events)} events",
+                f" Test completed successfully - received {event_count} events",
                 fg=typer.colors.GREEN,
             )
 
-    def inspect_agent(self, resource_name: str, verbose: bool = False) -> bool:
+    def inspect_agent(
+        self, resource_name: str, verbose: bool = False, use_cache: bool = True
+    ) -> bool:
         """
         Inspect a deployed Agent Engine to see its configuration and service account details.
 
         Args:
             resource_name: Resource name of the agent to inspect
             verbose: Show additional details including full REST API response
+            use_cache: Serve the REST response from the on-disk cache if fresh
 
         Returns:
             True if successful, False otherwise
         """
+        if not _check_resource_name(resource_name):
+            return False
+
         try:
             typer.echo("\n" + "=" * 80)
             typer.secho("Inspecting Agent Engine", fg=typer.colors.CYAN, bold=True)
             typer.echo("=" * 80 + "\n")
 
-            # Get the agent using agent_engines API
+            # Get the agent, reusing a cached handle when available
             typer.echo(f"Fetching agent: {resource_name}")
-            remote_app = agent_engines.get(resource_name)
+            remote_app = self._get_remote_app(resource_name)
 
             # Display basic information
             typer.secho("\nBasic Information:", fg=typer.colors.YELLOW, bold=True)
             typer.echo(f"Resource Name: {resource_name}")
-            if hasattr(remote_app, "display_name"):
-                typer.echo(f"Display Name: {remote_app.display_name}")
+            # One defaulted getattr instead of a hasattr/getattr pair
+            display_name = getattr(remote_app, "display_name", None)
+            if display_name is not None:
+                typer.echo(f"Display Name: {display_name}")
 
             # Try to access various attributes
             typer.secho("\nAgent Attributes:", fg=typer.colors.YELLOW, bold=True)
-            interesting_attrs = [
-                "resource_name",
-                "display_name",
-                "create_time",
-                "update_time",
-                "state",
-                "spec",
-                "deployment_spec",
-                "service_account",
-            ]
-
-            for attr in interesting_attrs:
-                if hasattr(remote_app, attr):
+            # Snapshot the instance dict once so plain attributes resolve
+            # with a single hash lookup instead of a hasattr/getattr pair;
+            # property-backed attributes still fall back to getattr.
+            try:
+                snapshot = vars(remote_app)
+            except TypeError:
+                snapshot = {}
+            for attr in _INTERESTING_ATTRS:
+                if attr in snapshot:
+                    value = snapshot[attr]
+                else:
                     try:
-                        value = getattr(remote_app, attr)
-                        if value is not None and not callable(value):
-                            if attr in ["create_time", "update_time"]:
-                                typer.echo(f"{attr}: {value}")
-                            else:
-                                typer.echo(f"{attr}: {value}")
+                        value = getattr(remote_app, attr, None)
                     except Exception as e:
                         typer.secho(
                             f"{attr}: Error accessing - {e}", fg=typer.colors.RED
                         )
+                        continue
+                if value is not None and not callable(value):
+                    typer.echo(f"{attr}: {value}")
 
             # Get full REST API response for detailed inspection
             if verbose:
@@ -842,132 +1648,254 @@ class AgentEngineManager:
                     bold=True,
                 )
                 try:
-                    # Get access token from credentials
-                    from google.auth import default
-                    from google.auth.transport import requests as auth_requests
+                    data = self._fetch_rest(resource_name, use_cache=use_cache)
+                    self._render_rest_data(data)
+                except Exception as e:
+                    typer.secho(
+                        f"\nError fetching REST API details: {e}", fg=typer.colors.RED
+                    )
+                    logger.error("REST API error: %s", e, exc_info=True)
+
+            # Show recommendations
+            self._echo_recommendations()
+
+            return True
 
-                    credentials, _ = default()
+        except Exception as e:
+            typer.secho(f" Error inspecting agent: {e}", fg=typer.colors.RED)
+            logger.error("Inspection error: %s", e, exc_info=True)
+            return False
+
+    def _fetch_rest(self, resource_name: str, use_cache: bool = True) -> dict:
+        """Fetch the full REST representation of an agent engine.
+
+        Responses are cached on disk for CACHE_TTL_SECONDS so repeated
+        inspections during a dev loop are served in milliseconds. Safe to
+        call from worker threads; the session pool and token cache are both
+        shared and locked where needed.
+
+        Raises:
+            RuntimeError: If the API returns a non-200 status.
+        """
+        cache_key = _cache_key(self.project, self.location, resource_name)
+        if use_cache:
+            cached = _cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        api_url = (
+            f"https://{self.location}-aiplatform.googleapis.com/v1/{resource_name}"
+        )
+        headers = {
+            "Authorization": f"Bearer {self._get_access_token()}",
+            "Content-Type": "application/json",
+        }
+        self._bucket.acquire()
+        response = self._rest_get(api_url, headers)
+        if response.status_code == 401:
+            # Cached token revoked early; refresh once and retry
+            headers["Authorization"] = (
+                f"Bearer {self._get_access_token(force_refresh=True)}"
+            )
+            response = self._rest_get(api_url, headers)
+        if response.status_code != 200:
+            raise RuntimeError(
+                f"REST API error {response.status_code}: {response.text}"
+            )
+        data = self._parse_json_response(response)
+        self._mask_sensitive_env(data)
+        _cache_put(cache_key, data)
+        return data
+
+    @staticmethod
+    def _mask_sensitive_env(data: dict) -> None:
+        """Mask secret-bearing env values in a REST payload, in place.
+
+        deploymentSpec.env carries values like SOAR_APP_KEY and VT_APIKEY;
+        masking before the payload is cached or returned keeps secrets out
+        of ~/.cache and off the terminal, not just out of the rendered view.
+        """
+        env_vars = data.get("spec", {}).get("deploymentSpec", {}).get("env") or []
+        for env_var in env_vars:
+            if _SENSITIVE_RE.search(env_var.get("name", "")):
+                env_var["value"] = "*" * 8
+
+    @staticmethod
+    def _render_rest_data(data: dict) -> None:
+        """Print the REST representation of an agent engine."""
+        typer.secho("\nREST API Response:", fg=typer.colors.CYAN)
+        typer.echo(_dumps_pretty(data))
+
+        # Try to extract service account if present
+        spec = data.get("spec", {})
+        if "serviceAccount" in spec:
+            typer.secho(
+                f"\nService Account: {spec['serviceAccount']}",
+                fg=typer.colors.GREEN,
+                bold=True,
+            )
 
-                    # Ensure credentials are refreshed
-                    if not credentials.valid:
-                        request = auth_requests.Request()
-                        credentials.refresh(request)
+        # Show environment variables if present
+        env_vars = spec.get("deploymentSpec", {}).get("env")
+        if env_vars:
+            typer.secho("\nEnvironment Variables:", fg=typer.colors.YELLOW, bold=True)
+            for env_var in env_vars:
+                name = env_var.get("name", "")
+                value = env_var.get("value", "")
+                # Mask sensitive values
+                if _SENSITIVE_RE.search(name):
+                    value = "*" * 8
+                typer.echo(f"  {name}: {value}")
+
+    def inspect_all(self, verbose: bool = False, use_cache: bool = True) -> bool:
+        """
+        Inspect every deployed Agent Engine in one pass.
 
-                    access_token = credentials.token
+        A single list RPC supplies the per-agent payloads; in verbose mode
+        the REST representations are fetched concurrently in worker threads
+        and rendered sequentially afterwards so output never interleaves.
 
-                    # Make REST API call
-                    import requests
+        Args:
+            verbose: Show additional details including full REST API response
+            use_cache: Serve REST responses from the on-disk cache if fresh
 
-                    api_url = f"https://{self.location}-aiplatform.googleapis.com/v1/{resource_name}"
-                    headers = {
-                        "Authorization": f"Bearer {access_token}",
-                        "Content-Type": "application/json",
-                    }
+        Returns:
+            True if every agent was inspected successfully, False otherwise
+        """
+        agents = self.list_agents(verbose=False)
+        if not agents:
+            return False
 
-                    response = requests.get(api_url, headers=headers)
-                    if response.status_code == 200:
-                        data = response.json()
+        rest_payloads: dict = {}
+        if verbose:
 
-                        typer.secho("\nREST API Response:", fg=typer.colors.CYAN)
-                        typer.echo(json.dumps(data, indent=2))
+            async def fetch_all():
+                semaphore = asyncio.Semaphore(16)
 
-                        # Try to extract service account if present
-                        if "spec" in data and "serviceAccount" in data.get("spec", {}):
-                            typer.secho(
-                                f"\nService Account: {data['spec']['serviceAccount']}",
-                                fg=typer.colors.GREEN,
-                                bold=True,
+                async def fetch(name):
+                    async with semaphore:
+                        try:
+                            return name, await asyncio.to_thread(
+                                self._fetch_rest, name, use_cache
                             )
+                        except Exception as e:
+                            return name, e
 
-                        # Show environment variables if present
-                        if "spec" in data:
-                            spec = data["spec"]
-                            if "deploymentSpec" in spec:
-                                deploy_spec = spec["deploymentSpec"]
-                                if "env" in deploy_spec:
-                                    typer.secho(
-                                        "\nEnvironment Variables:",
-                                        fg=typer.colors.YELLOW,
-                                        bold=True,
-                                    )
-                                    for env_var in deploy_spec["env"]:
-                                        name = env_var.get("name", "")
-                                        value = env_var.get("value", "")
-                                        # Mask sensitive values
-                                        if any(
-                                            x in name.upper()
-                                            for x in [
-                                                "KEY",
-                                                "SECRET",
-                                                "PASSWORD",
-                                                "TOKEN",
-                                            ]
-                                        ):
-                                            value = "*" * 8
-                                        typer.echo(f"  {name}: {value}")
-                    else:
-                        typer.secho(
-                            f"\nREST API Error: {response.status_code}",
-                            fg=typer.colors.RED,
-                        )
-                        typer.echo(response.text)
+                return dict(
+                    await asyncio.gather(*(fetch(a["resource_name"]) for a in agents))
+                )
 
-                except Exception as e:
+            rest_payloads = asyncio.run(fetch_all())
+
+        success = True
+        for agent in agents:
+            proto = agent.get("proto")
+            if proto is not None:
+                self._inspect_from_proto(proto)
+            else:
+                success = self.inspect_agent(agent["resource_name"]) and success
+            if verbose:
+                payload = rest_payloads.get(agent["resource_name"])
+                if isinstance(payload, Exception):
                     typer.secho(
-                        f"\nError fetching REST API details: {e}", fg=typer.colors.RED
+                        f"\nError fetching REST API details: {payload}",
+                        fg=typer.colors.RED,
                     )
-                    logging.error(f"REST API error: {e}", exc_info=True)
+                    success = False
+                elif payload is not None:
+                    self._render_rest_data(payload)
+        return success
+
+    def _echo_recommendations(self) -> None:
+        """Print the service account recommendations footer."""
+        typer.secho("\nRecommendations:", fg=typer.colors.YELLOW, bold=True)
+        typer.echo("1. Reasoning Engines typically use the Vertex AI service agent:")
+        typer.echo(
+            f"   service-{'PROJECT_NUMBER' if '/' in self.project else self.project}@gcp-sa-aiplatform.iam.gserviceaccount.com"
+        )
+        typer.echo("2. Or the Compute Engine default service account:")
+        typer.echo("   PROJECT_NUMBER-compute@developer.gserviceaccount.com")
+        typer.echo("3. Grant necessary permissions to the appropriate service account")
 
-            # Show recommendations
-            typer.secho("\nRecommendations:", fg=typer.colors.YELLOW, bold=True)
-            typer.echo(
-                "1. Reasoning Engines typically use the Vertex AI service agent:"
-            )
-            typer.echo(
-                f"   service-{self.project.split('/')[-1] if '/' not in self.project else 'PROJECT_NUMBER'}@gcp-sa-aiplatform.iam.gserviceaccount.com"
-            )
-            typer.echo("2. Or the Compute Engine default service account:")
-            typer.echo("   PROJECT_NUMBER-compute@developer.gserviceaccount.com")
-            typer.echo(
-                "3. Grant necessary permissions to the appropriate service account"
-            )
+    def _inspect_from_proto(self, proto) -> bool:
+        """Render an inspection from a list-response proto.
 
-            return True
+        The list RPC already carries the engine name, display name,
+        timestamps, and spec, so an inspection that immediately follows a
+        listing can be answered from that payload.
+        """
+        typer.echo("\n" + "=" * 80)
+        typer.secho("Inspecting Agent Engine", fg=typer.colors.CYAN, bold=True)
+        typer.echo("=" * 80 + "\n")
 
-        except Exception as e:
-            typer.secho(f" Error inspecting agent: {e}", fg=typer.colors.RED)
-            logging.error(f"Inspection error: {e}", exc_info=True)
-            return False
+        typer.secho("\nBasic Information:", fg=typer.colors.YELLOW, bold=True)
+        typer.echo(f"Resource Name: {proto.name}")
+        typer.echo(f"Display Name: {proto.display_name}")
+
+        typer.secho("\nAgent Attributes:", fg=typer.colors.YELLOW, bold=True)
+        for attr in ("create_time", "update_time", "state", "spec"):
+            value = getattr(proto, attr, None)
+            if value:
+                typer.echo(f"{attr}: {value}")
 
-    def inspect_agent_by_index(self, index: int, verbose: bool = False) -> bool:
+        self._echo_recommendations()
+        return True
+
+    def inspect_agent_by_index(
+        self, index: int, verbose: bool = False, use_cache: bool = True
+    ) -> bool:
         """
         Inspect an agent by its index in the list.
 
         Args:
             index: Index of the agent in the list (1-based)
             verbose: Show additional details
+            use_cache: Serve REST responses from the on-disk cache if fresh
 
         Returns:
             True if successful, False otherwise
         """
-        agents = self.list_agents(verbose=False)
-
-        if not agents:
+        cached_name = self._resource_at_index(index)
+        if cached_name is not None:
+            return self.inspect_agent(cached_name, verbose, use_cache=use_cache)
+        proto = self._agent_at_index(index)
+        if proto is None:
             return False
+        # The lookup already fetched everything a non-verbose inspection
+        # prints; only the verbose REST path needs the full fetch.
+        if not verbose:
+            return self._inspect_from_proto(proto)
+        return self.inspect_agent(proto.name, verbose, use_cache=use_cache)
 
-        if index < 1 or index > len(agents):
-            typer.secho(
-                f" Invalid index. Please choose between 1 and {len(agents)}",
-                fg=typer.colors.RED,
-            )
-            return False
 
-        agent = agents[index - 1]
-        return self.inspect_agent(agent["resource_name"], verbose)
+@functools.lru_cache(maxsize=4)
+def _load_env(resolved_path: str, mtime_ns: int) -> bool:
+    """Parse the env file into os.environ once per (path, mtime) pair.
 
+    The mtime key means edits to the file invalidate the cache naturally,
+    while unchanged files are parsed at most once per process no matter how
+    many managers are constructed.
+    """
+    return load_dotenv(resolved_path, override=True)
 
-@app.command()
-def list(
+
+# Process-wide manager registry keyed by env file. Commands invoked in the
+# same process (tests, shell completion, scripted use of the Typer app)
+# share one manager and therefore one set of authenticated clients instead
+# of repeating env parsing and SDK init per command.
+_MANAGERS: dict[Path, AgentEngineManager] = {}
+
+
+def get_manager(env_file: Path) -> AgentEngineManager:
+    """Return the shared manager for env_file, constructing it on first use."""
+    manager = _MANAGERS.get(env_file)
+    if manager is None:
+        manager = _MANAGERS[env_file] = AgentEngineManager(env_file)
+    return manager
+
+
+@app.command("list")
+def list_(
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Show detailed information.")
     ] = False,
@@ -976,7 +1904,7 @@ def list(
     ] = Path(".env"),
 ) -> None:
     """List all Agent Engine instances in the project."""
-    manager = AgentEngineManager(env_file)
+    manager = get_manager(env_file)
     manager.list_agents(verbose)
 
 
@@ -994,6 +1922,13 @@ def delete(
             "--index", "-i", help="Index of the agent from the list to delete"
         ),
     ] = None,
+    indices: Annotated[
+        str | None,
+        typer.Option(
+            "--indices",
+            help="Comma-separated indices to delete in one batch, e.g. 1,3,5",
+        ),
+    ] = None,
     force: Annotated[
         bool, typer.Option("--force", "-f", help="Skip confirmation prompt")
     ] = False,
@@ -1001,25 +1936,24 @@ def delete(
         Path, typer.Option(help="Path to the environment file.")
     ] = Path(".env"),
 ) -> None:
-    """Delete an Agent Engine instance by resource name or index."""
-    if not resource and not index:
-        typer.secho(
-            " Error: Either --resource or --index must be provided",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
+    """Delete Agent Engine instances by resource name, index, or index batch."""
+    provided = [p for p in (resource, index, indices) if p is not None]
+    if not provided:
+        raise _err(" Error: Either --resource, --index, or --indices must be provided")
 
-    if resource and index:
-        typer.secho(
-            " Error: Cannot specify both --resource and --index",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
+    if len(provided) > 1:
+        raise _err(" Error: Specify only one of --resource, --index, or --indices")
 
-    manager = AgentEngineManager(env_file)
+    manager = get_manager(env_file)
 
-    if resource:
+    if resource is not None:
         success = manager.delete_agent(resource, force)
+    elif indices is not None:
+        try:
+            index_list = [int(part) for part in indices.split(",") if part.strip()]
+        except ValueError:
+            raise _err(f" Error: Invalid --indices value: {indices}")
+        success = manager.delete_agents_by_indices(index_list, force)
     else:  # index
         success = manager.delete_agent_by_index(index, force)
 
@@ -1048,7 +1982,7 @@ def create(
     ] = Path(".env"),
 ) -> None:
     """Create and deploy a new Agent Engine instance."""
-    manager = AgentEngineManager(env_file)
+    manager = get_manager(env_file)
     resource_name = manager.create_agent(agent_module, debug, no_test)
 
     if resource_name:
@@ -1057,15 +1991,52 @@ def create(
         typer.echo("=" * 80)
         typer.echo("\nSave these values to your .env file:")
         typer.echo(f"AGENT_ENGINE_RESOURCE_NAME={resource_name}")
-        # Extract the numeric ID from the resource name
-        engine_id = (
-            resource_name.split("/")[-1] if "/" in resource_name else resource_name
-        )
+        # Extract the numeric ID from the resource name; rpartition scans
+        # once from the right and returns the whole string when there is no
+        # separator, so no containment pre-check is needed
+        engine_id = resource_name.rpartition("/")[2]
         typer.echo(f"AGENT_ENGINE_ID={engine_id}")
     else:
         raise typer.Exit(code=1)
 
 
+@app.command("create-all")
+def create_all(
+    agent_modules: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--agent-module",
+            "-a",
+            help="Agent module to deploy; repeat for several. Defaults to all known modules.",
+        ),
+    ] = None,
+    no_test: Annotated[
+        bool, typer.Option("--no-test", help="Skip automatic test after creation")
+    ] = False,
+    env_file: Annotated[
+        Path, typer.Option(help="Path to the environment file.")
+    ] = Path(".env"),
+) -> None:
+    """Create and deploy multiple Agent Engine instances concurrently."""
+    if not agent_modules:
+        agent_modules = [*DEFAULT_AGENT_MODULES]
+
+    manager = get_manager(env_file)
+    results = asyncio.run(manager.create_agents_batch(agent_modules, no_test))
+
+    typer.echo("\n" + "=" * 80)
+    typer.secho("BATCH DEPLOYMENT RESULTS", fg=typer.colors.GREEN, bold=True)
+    typer.echo("=" * 80)
+    for module, resource_name in zip(agent_modules, results, strict=True):
+        if resource_name:
+            typer.secho(f"{module}: {resource_name}", fg=typer.colors.GREEN)
+        else:
+            typer.secho(f"{module}: FAILED", fg=typer.colors.RED)
+
+    if not any(results):
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def test(
     resource: Annotated[
@@ -1078,45 +2049,44 @@ def test(
         int | None,
         typer.Option("--index", "-i", help="Index of the agent from the list to test"),
     ] = None,
+    messages: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--message",
+            "-m",
+            help="Query to send; repeat the option to send several concurrently.",
+        ),
+    ] = None,
     env_file: Annotated[
         Path, typer.Option(help="Path to the environment file.")
     ] = Path(".env"),
 ) -> None:
-    """Test an Agent Engine instance with a sample query."""
-    if not resource and not index:
+    """Test an Agent Engine instance with one or more sample queries."""
+    if resource is None and index is None:
         # Try to get from environment
-        manager = AgentEngineManager(env_file)
+        manager = get_manager(env_file)
         resource = manager.env_vars.get("AGENT_ENGINE_RESOURCE_NAME")
         if not resource:
-            typer.secho(
-                " Error: Either --resource, --index, or AGENT_ENGINE_RESOURCE_NAME in .env must be provided",
-                fg=typer.colors.RED,
+            raise _err(
+                " Error: Either --resource, --index, or AGENT_ENGINE_RESOURCE_NAME in .env must be provided"
             )
-            raise typer.Exit(code=1)
 
-    if resource and index:
-        typer.secho(
-            " Error: Cannot specify both --resource and --index",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
+    if resource is not None and index is not None:
+        raise _err(" Error: Cannot specify both --resource and --index")
 
-    manager = AgentEngineManager(env_file)
+    manager = get_manager(env_file)
 
-    if index:
-        # Get agent by index
-        agents = manager.list_agents(verbose=False)
-        if not agents:
-            raise typer.Exit(code=1)
-        if index < 1 or index > len(agents):
-            typer.secho(
-                f" Invalid index. Please choose between 1 and {len(agents)}",
-                fg=typer.colors.RED,
-            )
-            raise typer.Exit(code=1)
-        resource = agents[index - 1]["resource_name"]
+    if index is not None:
+        # Get agent by index: try the cached listing order first, then
+        # fetch only as many pages as the index requires
+        resource = manager._resource_at_index(index)
+        if resource is None:
+            proto = manager._agent_at_index(index)
+            if proto is None:
+                raise typer.Exit(code=1)
+            resource = proto.name
 
-    success = manager.test_agent_with_resource(resource)
+    success = manager.test_agent_with_resource(resource, messages)
     if not success:
         raise typer.Exit(code=1)
 
@@ -1143,35 +2113,50 @@ def inspect(
             help="Show detailed information including REST API response",
         ),
     ] = False,
+    all_agents: Annotated[
+        bool,
+        typer.Option("--all", help="Inspect every deployed agent"),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option("--no-cache", help="Bypass the on-disk REST response cache."),
+    ] = False,
     env_file: Annotated[
         Path, typer.Option(help="Path to the environment file.")
     ] = Path(".env"),
 ) -> None:
     """Inspect an Agent Engine instance to see its configuration and service account details."""
-    if not resource and not index:
+    # Reject a malformed --resource before the manager exists at all, so
+    # the scripted fast path pays no env parsing or SDK init just to fail
+    if resource is not None and not _check_resource_name(resource):
+        raise typer.Exit(code=1)
+
+    # One manager serves every branch below; constructing it per branch
+    # doubled env parsing and SDK init before the registry existed
+    manager = get_manager(env_file)
+
+    if all_agents:
+        if resource is not None or index is not None:
+            raise _err(" Error: Cannot combine --all with --resource or --index")
+        if not manager.inspect_all(verbose, use_cache=not no_cache):
+            raise typer.Exit(code=1)
+        return
+
+    if resource is None and index is None:
         # Try to get from environment
-        manager = AgentEngineManager(env_file)
         resource = manager.env_vars.get("AGENT_ENGINE_RESOURCE_NAME")
         if not resource:
-            typer.secho(
-                " Error: Either --resource, --index, or AGENT_ENGINE_RESOURCE_NAME in .env must be provided",
-                fg=typer.colors.RED,
+            raise _err(
+                " Error: Either --resource, --index, or AGENT_ENGINE_RESOURCE_NAME in .env must be provided"
             )
-            raise typer.Exit(code=1)
-
-    if resource and index:
-        typer.secho(
-            " Error: Cannot specify both --resource and --index",
-            fg=typer.colors.RED,
-        )
-        raise typer.Exit(code=1)
 
-    manager = AgentEngineManager(env_file)
+    if resource is not None and index is not None:
+        raise _err(" Error: Cannot specify both --resource and --index")
 
-    if index:
-        success = manager.inspect_agent_by_index(index, verbose)
+    if index is not None:
+        success = manager.inspect_agent_by_index(index, verbose, use_cache=not no_cache)
     else:
-        success = manager.inspect_agent(resource, verbose)
+        success = manager.inspect_agent(resource, verbose, use_cache=not no_cache)
 
     if not success:
         raise typer.Exit(code=1)
@@ -1212,7 +2197,7 @@ def list_assistants(
     Example:
         python manage_agent_engine.py list-assistants --engine my-engine-id
     """
-    manager = AgentEngineManager(env_file)
+    manager = get_manager(env_file)
     assistants = manager.list_assistants(
         engine_id=engine_id, collection_id=collection, verbose=verbose
     )
@@ -1248,9 +2233,9 @@ def list_engines(
     Example:
         python manage_agent_engine.py list-engines
     """
-    manager = AgentEngineManager(env_file)
+    manager = get_manager(env_file)
 
-    if not discoveryengine:
+    if not _discoveryengine():
         typer.secho(
             " Discovery Engine client library not installed.", fg=typer.colors.RED
         )
@@ -1281,7 +2266,7 @@ def list_engines(
         )
 
         for i, engine in enumerate(engines, 1):
-            engine_id = engine["name"].split("/")[-1]
+            engine_id = engine["name"].rpartition("/")[2]
             typer.secho(f"{i}. {engine_id}", fg=typer.colors.CYAN)
             typer.echo(f"   Display Name: {engine['display_name']}")
             typer.echo(f"   Solution Type: {engine['solution_type']}")
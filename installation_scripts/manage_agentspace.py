@@ -6,7 +6,12 @@ This script manages AgentSpace operations including registration, updates,
 verification, and deletion of agents in AgentSpace.
 """
 
+import json
 import os
+import time
+from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC
 from pathlib import Path
 from typing import Annotated, Any
 
@@ -15,6 +20,7 @@ import requests
 import typer
 from dotenv import load_dotenv
 from google.auth.transport import requests as google_requests
+from requests.adapters import HTTPAdapter
 
 # Import validation utilities
 from installation_scripts.env_validation import (
@@ -55,52 +61,112 @@ class AgentSpaceManager:
         self.env_file = env_file
         self.env_vars = self._load_env_vars()
         self.creds, self.project = google.auth.default()
+        # Cached (token, expiry_epoch) pair for paths that build their own
+        # Authorization header; refreshed only when close to expiry.
+        self._token_cache: tuple[str, float] | None = None
+
+        # One authorized session for the lifetime of the manager: keep-alive
+        # reuses a single TLS connection to discoveryengine.googleapis.com
+        # across register/verify/update/link flows instead of paying a fresh
+        # TCP+TLS handshake per call. AuthorizedSession injects and refreshes
+        # the Authorization header itself.
+        self._session = google_requests.AuthorizedSession(self.creds)
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        )
+
+        # Precompute the agents endpoint base URL; every register/update/
+        # verify/delete/link/unlink call appends at most an agent ID to it.
+        # Unconfigured managers (e.g. create_app before an app exists) leave
+        # it unset and compute lazily instead.
+        try:
+            self._agents_url_base: str | None = self._compute_agents_url_base()
+        except KeyError:
+            self._agents_url_base = None
 
-    def _load_env_vars(self) -> dict[str, str]:
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def _load_env_vars(self) -> MutableMapping[str, str]:
         """Load environment variables from the .env file using python-dotenv."""
         # Load .env file into environment
         if self.env_file.exists():
             load_dotenv(self.env_file, override=True)
 
-        # Get all environment variables (includes both .env and system env vars)
-        # dotenv handles quotes, comments, and spaces properly
-        env_vars = dict(os.environ)
-        return env_vars
+        # Return the live process environment (includes both .env and system
+        # env vars); only a handful of keys are ever read, so copying the
+        # whole environment into a dict would be wasted work, and writes stay
+        # visible to spawned subprocesses.
+        return os.environ
+
+    def _update_env_vars(self, updates: dict[str, str]) -> None:
+        """Update several environment variables in the .env file at once.
+
+        Reads the file once, rewrites every matching assignment in a single
+        pass, appends any keys not already present, and writes once. Callers
+        with multiple keys to persist should batch them here rather than
+        rewriting the file per key.
+        """
+        if not updates:
+            return
 
-    def _update_env_var(self, key: str, value: str) -> None:
-        """Update an environment variable in the .env file."""
         if not self.env_file.exists():
             self.env_file.touch()
 
-        lines = []
-        if self.env_file.exists():
-            with open(self.env_file) as f:
-                lines = f.readlines()
+        with open(self.env_file) as f:
+            lines = f.readlines()
 
-        # Find existing key or add new one
-        key_found = False
+        # Rewrite existing assignments; whatever is left gets appended
+        remaining = dict(updates)
         for i, line in enumerate(lines):
-            if line.strip() and not line.strip().startswith("#") and "=" in line:
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#") and "=" in line:
                 existing_key = line.split("=", 1)[0].strip()
-                if existing_key == key:
-                    lines[i] = f"{key}={value}\n"
-                    key_found = True
-                    break
+                if existing_key in remaining:
+                    lines[i] = f"{existing_key}={remaining.pop(existing_key)}\n"
+                    if not remaining:
+                        break
 
-        if not key_found:
+        for key, value in remaining.items():
             lines.append(f"{key}={value}\n")
 
         with open(self.env_file, "w") as f:
             f.writelines(lines)
 
-        # Update in-memory env_vars
-        self.env_vars[key] = value
+        # env_vars is the live os.environ, so this also keeps the values
+        # visible to any subprocesses spawned later
+        self.env_vars.update(updates)
+
+    def _update_env_var(self, key: str, value: str) -> None:
+        """Update an environment variable in the .env file."""
+        self._update_env_vars({key: value})
 
     def _get_access_token(self) -> str | None:
-        """Get Google Cloud access token."""
+        """Get Google Cloud access token, refreshing only near expiry.
+
+        The token is cached with its expiry so chained operations (e.g. the
+        N+2 requests in _ensure_data_store_exists) do not pay a refresh
+        round-trip per call. A refresh is triggered only when fewer than 60
+        seconds remain. The pooled AuthorizedSession handles its own auth;
+        this is the fallback for paths that build headers manually.
+        """
+        if self._token_cache is not None:
+            token, expiry = self._token_cache
+            if expiry - time.time() > 60:
+                return token
+
         if not self.creds.valid:
             self.creds.refresh(google_requests.Request())
-        return self.creds.token
+
+        token = self.creds.token
+        if token and self.creds.expiry is not None:
+            # google-auth expiry is a naive UTC datetime; pin the timezone
+            # before converting so the epoch comparison is not skewed by the
+            # host's UTC offset
+            expiry = self.creds.expiry.replace(tzinfo=UTC)
+            self._token_cache = (token, expiry.timestamp())
+        return token
 
     def _validate_environment(self) -> tuple[bool, list]:
         """
@@ -124,12 +190,9 @@ class AgentSpaceManager:
         self, method: str, url: str, **kwargs: Any
     ) -> requests.Response | None:
         """Make an authenticated request to the Discovery Engine API."""
-        access_token = self._get_access_token()
-        if not access_token:
-            return None
-
+        # AuthorizedSession adds the Authorization header and refreshes
+        # credentials on demand; only the project header is needed here.
         headers = {
-            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json",
             "X-Goog-User-Project": self.env_vars["GCP_PROJECT_NUMBER"],
         }
@@ -144,16 +207,14 @@ class AgentSpaceManager:
         if debug:
             typer.echo(f"DEBUG: {method} {url}")
             if "json" in kwargs:
-                import json as json_lib
-
                 typer.echo(
-                    f"DEBUG: Request body: {json_lib.dumps(kwargs['json'], indent=2)}"
+                    f"DEBUG: Request body: {json.dumps(kwargs['json'], indent=2)}"
                 )
             typer.echo(f"DEBUG: Timeout: {kwargs['timeout']}s")
 
         try:
             typer.echo(f"  Sending {method} request to API...")
-            response = requests.request(method, url, headers=headers, **kwargs)
+            response = self._session.request(method, url, headers=headers, **kwargs)
             if debug:
                 typer.echo(f"DEBUG: Response status: {response.status_code}")
                 typer.echo(f"DEBUG: Response body: {response.text[:500]}")
@@ -176,21 +237,25 @@ class AgentSpaceManager:
                 typer.echo(f"  Response: {e.response.text}")
             return None
 
-    def _get_agent_api_url(self, agent_id: str | None = None) -> str:
-        """Construct the API URL for AgentSpace agents."""
+    def _compute_agents_url_base(self) -> str:
+        """Build the agents endpoint base URL from the environment."""
         project_number = self.env_vars["GCP_PROJECT_NUMBER"]
         app_id = self.env_vars["AGENTSPACE_APP_ID"]
         collection = self.env_vars.get("AGENTSPACE_COLLECTION", "default_collection")
         assistant = self.env_vars.get("AGENTSPACE_ASSISTANT", "default_assistant")
 
-        url = (
+        return (
             f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/"
             f"locations/global/collections/{collection}/engines/{app_id}/"
             f"assistants/{assistant}/agents"
         )
-        if agent_id:
-            url += f"/{agent_id}"
-        return url
+
+    def _get_agent_api_url(self, agent_id: str | None = None) -> str:
+        """Construct the API URL for AgentSpace agents."""
+        base = self._agents_url_base
+        if base is None:
+            base = self._compute_agents_url_base()
+        return f"{base}/{agent_id}" if agent_id else base
 
     def _build_agent_config(self) -> dict[str, Any]:
         """Build the agent configuration payload."""
@@ -242,24 +307,7 @@ class AgentSpaceManager:
         api_url = self._get_agent_api_url()
         agent_config = self._build_agent_config()
 
-        access_token = self._get_access_token()
-        if not access_token:
-            return False
-
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "X-Goog-User-Project": self.env_vars["GCP_PROJECT_NUMBER"],
-        }
-
-        try:
-            response = requests.post(api_url, headers=headers, json=agent_config)
-            response.raise_for_status()
-        except requests.exceptions.RequestException as e:
-            typer.secho(f" API request failed: {e}", fg=typer.colors.RED)
-            if e.response is not None:
-                typer.echo(f"  Response: {e.response.text}")
-            return False
+        response = self._make_request("POST", api_url, json=agent_config)
         if response and response.status_code == 200:
             result = response.json()
             agent_name = result.get("name", "")
@@ -403,8 +451,6 @@ class AgentSpaceManager:
             typer.echo()
 
         # Generate app ID with timestamp
-        import time
-
         if not app_name:
             app_name = "agentic-soc-app"
         app_id = f"{app_name.lower().replace(' ', '-')}_{int(time.time())}"
@@ -485,10 +531,8 @@ class AgentSpaceManager:
             typer.echo("  Data stores: None (app will be created without data stores)")
 
         # Debug: Print the config being sent
-        import json as json_lib
-
         typer.echo("  Config being sent:")
-        typer.echo(json_lib.dumps(app_config, indent=2))
+        typer.echo(json.dumps(app_config, indent=2))
 
         response = self._make_request(
             "POST", url, json=app_config, params={"engineId": app_id}
@@ -605,13 +649,19 @@ class AgentSpaceManager:
                 f"  Engine has {len(data_store_ids)} data store(s) configured: {', '.join(data_store_ids)}"
             )
 
-            # Verify each data store exists
-            for ds_id in data_store_ids:
-                ds_url = (
-                    f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/"
-                    f"locations/global/collections/{collection}/dataStores/{ds_id}"
+            # Verify each data store exists. The per-store GETs are
+            # independent, so fan them out over the pooled session and wait
+            # ~one round-trip instead of one per store.
+            ds_urls = [
+                f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/"
+                f"locations/global/collections/{collection}/dataStores/{ds_id}"
+                for ds_id in data_store_ids
+            ]
+            with ThreadPoolExecutor(max_workers=min(8, len(ds_urls))) as executor:
+                responses = list(
+                    executor.map(lambda url: self._make_request("GET", url), ds_urls)
                 )
-                ds_response = self._make_request("GET", ds_url)
+            for ds_id, ds_response in zip(data_store_ids, responses, strict=True):
                 if ds_response:
                     ds_data = ds_response.json()
                     typer.echo(f"    - {ds_id}: {ds_data.get('displayName', 'exists')}")
@@ -629,10 +679,16 @@ class AgentSpaceManager:
             " No data stores found. Creating unstructured data store...",
             fg=typer.colors.YELLOW,
         )
-        return self._create_website_datastore()
+        return self._create_website_datastore(existing_ids=data_store_ids)
 
-    def _create_website_datastore(self) -> bool:
-        """Create an unstructured data store for search."""
+    def _create_website_datastore(self, existing_ids: list[str]) -> bool:
+        """Create an unstructured data store for search.
+
+        Args:
+            existing_ids: Data store IDs already linked to the engine, as
+                reported by the caller's engine GET. Passing them in avoids
+                re-fetching the engine just to read dataStoreIds.
+        """
         project_number = self.env_vars["GCP_PROJECT_NUMBER"]
         app_id = self.env_vars["AGENTSPACE_APP_ID"]
         collection = self.env_vars.get("AGENTSPACE_COLLECTION", "default_collection")
@@ -674,15 +730,8 @@ class AgentSpaceManager:
             f"locations/global/collections/{collection}/engines/{app_id}"
         )
 
-        # Get existing data stores
-        engine_response = self._make_request("GET", engine_url)
-        existing_ids = []
-        if engine_response:
-            engine_data = engine_response.json()
-            existing_ids = engine_data.get("dataStoreIds", [])
-
-        # Add new data store to existing ones
-        all_data_stores = list(set(existing_ids + [data_store_id]))
+        # Add new data store to the ones the caller already fetched
+        all_data_stores = list({*existing_ids, data_store_id})
 
         # Update engine with new data store list using PATCH
         update_config = {"dataStoreIds": all_data_stores}
@@ -746,21 +795,9 @@ class AgentSpaceManager:
             auth_id = self.env_vars.get("OAUTH_AUTH_ID")
 
         project_number = self.env_vars["GCP_PROJECT_NUMBER"]
-        as_app = self.env_vars["AGENTSPACE_APP_ID"]
         reasoning_engine = self.env_vars["AGENT_ENGINE_RESOURCE_NAME"]
 
-        access_token = self._get_access_token()
-        if not access_token:
-            typer.echo("Error: Failed to get access token", err=True)
-            return False
-
-        url = f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/locations/global/collections/default_collection/engines/{as_app}/assistants/default_assistant/agents"
-
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json",
-            "X-Goog-User-Project": project_number,
-        }
+        url = self._get_agent_api_url()
 
         data = {
             "displayName": display_name,
@@ -777,29 +814,23 @@ class AgentSpaceManager:
                 f"projects/{project_number}/locations/global/authorizations/{auth_id}"
             ]
 
-        try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-
-            result = response.json()
-            agent_name = result.get("name", "")
+        response = self._make_request("POST", url, json=data)
+        if not response:
+            return False
 
-            typer.echo("Successfully linked agent to AgentSpace!")
-            typer.echo(f"Agent name: {agent_name}")
+        result = response.json()
+        agent_name = result.get("name", "")
 
-            # Extract and save agent ID if present
-            if "/" in agent_name:
-                agent_id = agent_name.split("/")[-1]
-                self._update_env_var("AGENTSPACE_AGENT_ID", agent_id)
-                typer.echo(f"Agent ID saved to environment: {agent_id}")
+        typer.echo("Successfully linked agent to AgentSpace!")
+        typer.echo(f"Agent name: {agent_name}")
 
-            return True
+        # Extract and save agent ID if present
+        if "/" in agent_name:
+            agent_id = agent_name.split("/")[-1]
+            self._update_env_var("AGENTSPACE_AGENT_ID", agent_id)
+            typer.echo(f"Agent ID saved to environment: {agent_id}")
 
-        except requests.exceptions.RequestException as e:
-            typer.echo(f"Error linking agent to AgentSpace: {e}", err=True)
-            if hasattr(e.response, "text"):
-                typer.echo(f"Response: {e.response.text}", err=True)
-            return False
+        return True
 
     def unlink_agent_from_agentspace(
         self,
@@ -841,49 +872,26 @@ class AgentSpaceManager:
             typer.echo("Cancelled.")
             return False
 
-        project_number = self.env_vars["GCP_PROJECT_NUMBER"]
         as_app = self.env_vars["AGENTSPACE_APP_ID"]
-        collection = self.env_vars.get("AGENTSPACE_COLLECTION", "default_collection")
-        assistant = self.env_vars.get("AGENTSPACE_ASSISTANT", "default_assistant")
 
-        url = (
-            f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/"
-            f"locations/global/collections/{collection}/engines/{as_app}/"
-            f"assistants/{assistant}/agents/{agent_id}"
-        )
+        url = self._get_agent_api_url(agent_id)
 
-        access_token = self._get_access_token()
-        if not access_token:
-            typer.echo("Error: Failed to get access token", err=True)
+        response = self._make_request("DELETE", url)
+        if not response:
             return False
 
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "X-Goog-User-Project": project_number,
-        }
-
-        try:
-            response = requests.delete(url, headers=headers)
-            response.raise_for_status()
-
-            typer.secho(
-                " Agent unlinked successfully from AgentSpace!", fg=typer.colors.GREEN
-            )
-            typer.echo(f"  Agent ID {agent_id} removed from app {as_app}")
-            typer.echo("  Note: The AgentSpace app remains intact")
-
-            # Clear agent ID from environment if it matches
-            if agent_id == self.env_vars.get("AGENTSPACE_AGENT_ID"):
-                self._update_env_var("AGENTSPACE_AGENT_ID", "")
-                typer.echo("  Cleared AGENTSPACE_AGENT_ID from environment")
+        typer.secho(
+            " Agent unlinked successfully from AgentSpace!", fg=typer.colors.GREEN
+        )
+        typer.echo(f"  Agent ID {agent_id} removed from app {as_app}")
+        typer.echo("  Note: The AgentSpace app remains intact")
 
-            return True
+        # Clear agent ID from environment if it matches
+        if agent_id == self.env_vars.get("AGENTSPACE_AGENT_ID"):
+            self._update_env_var("AGENTSPACE_AGENT_ID", "")
+            typer.echo("  Cleared AGENTSPACE_AGENT_ID from environment")
 
-        except requests.exceptions.RequestException as e:
-            typer.echo(f"Error unlinking agent from AgentSpace: {e}", err=True)
-            if hasattr(e.response, "text"):
-                typer.echo(f"Response: {e.response.text}", err=True)
-            return False
+        return True
 
     def update_agent_config(
         self,
@@ -1013,10 +1021,8 @@ class AgentSpaceManager:
             engines = result.get("engines", [])
 
             if show_raw:
-                import json as json_lib
-
                 typer.echo("\n=== RAW JSON RESPONSE ===")
-                typer.echo(json_lib.dumps(result, indent=2))
+                typer.echo(json.dumps(result, indent=2))
                 typer.echo("=== END RAW JSON ===\n")
 
             if not engines:
@@ -1045,7 +1051,7 @@ class AgentSpaceManager:
 
                 if show_raw:
                     typer.echo("\n   === RAW ENGINE DATA ===")
-                    typer.echo(json_lib.dumps(engine, indent=4))
+                    typer.echo(json.dumps(engine, indent=4))
                     typer.echo("   === END ENGINE DATA ===")
 
                 typer.echo()
@@ -1078,88 +1084,73 @@ class AgentSpaceManager:
             typer.echo("Error: AGENTSPACE_APP_ID not found in environment", err=True)
             return False
 
-        access_token = self._get_access_token()
-        if not access_token:
-            typer.echo("Error: Failed to get access token", err=True)
-            return False
-
-        url = f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/locations/global/collections/default_collection/engines/{as_app}/assistants/default_assistant/agents"
-
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "X-Goog-User-Project": project_number,
-        }
-
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-
-            result = response.json()
-            agents = result.get("agents", [])
-
-            if show_raw:
-                import json as json_lib
+        agents_url = f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/locations/global/collections/default_collection/engines/{as_app}/assistants/default_assistant/agents"
+        engine_url = (
+            f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/"
+            f"locations/global/collections/default_collection/engines/{as_app}"
+        )
 
-                typer.echo("\n=== RAW JSON RESPONSE ===")
-                typer.echo(json_lib.dumps(result, indent=2))
-                typer.echo("=== END RAW JSON ===\n")
+        # The agents listing and the engine details (used for the solution
+        # type header) are independent, so issue both GETs concurrently over
+        # the pooled session instead of serializing the round-trips.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            agents_future = executor.submit(self._make_request, "GET", agents_url)
+            engine_future = executor.submit(self._make_request, "GET", engine_url)
+            response = agents_future.result()
+            engine_response = engine_future.result()
 
-            if not agents:
-                typer.echo("No agents found in AgentSpace app.")
-                return True
+        if not response:
+            typer.echo("Error listing agents", err=True)
+            return False
 
-            # Get engine details to show solution type
-            engine_url = (
-                f"{DISCOVERY_ENGINE_API_BASE}/projects/{project_number}/"
-                f"locations/global/collections/default_collection/engines/{as_app}"
-            )
-            engine_response = self._make_request("GET", engine_url)
-            solution_type = "N/A"
-            if engine_response:
-                engine_data = engine_response.json()
-                solution_type = engine_data.get("solutionType", "N/A")
-
-            typer.echo(f"\nFound {len(agents)} agent(s) in AgentSpace:\n")
-            typer.echo(f"Engine Solution Type: {solution_type}\n")
-            for i, agent in enumerate(agents, 1):
-                name = agent.get("name", "")
-                agent_id = name.split("/")[-1] if "/" in name else name
-                display_name = agent.get("displayName", "N/A")
-                description = agent.get("description", "N/A")
-
-                typer.echo(f"{i}. Agent ID: {agent_id}")
-                typer.echo(f"   Display Name: {display_name}")
-                typer.echo(f"   Description: {description}")
+        result = response.json()
+        agents = result.get("agents", [])
 
-                # Show tool description if available
-                adk_def = agent.get("adk_agent_definition", {})
-                tool_settings = adk_def.get("tool_settings", {})
-                if tool_settings.get("tool_description"):
-                    typer.echo(
-                        f"   Tool Description: {tool_settings['tool_description']}"
-                    )
+        if show_raw:
+            typer.echo("\n=== RAW JSON RESPONSE ===")
+            typer.echo(json.dumps(result, indent=2))
+            typer.echo("=== END RAW JSON ===\n")
 
-                # Show reasoning engine if available
-                prov_engine = adk_def.get("provisioned_reasoning_engine", {})
-                if prov_engine.get("reasoning_engine"):
-                    typer.echo(
-                        f"   Reasoning Engine: {prov_engine['reasoning_engine']}"
-                    )
+        if not agents:
+            typer.echo("No agents found in AgentSpace app.")
+            return True
 
-                if show_raw:
-                    typer.echo("\n   === RAW AGENT DATA ===")
-                    typer.echo(json_lib.dumps(agent, indent=4))
-                    typer.echo("   === END AGENT DATA ===")
+        solution_type = "N/A"
+        if engine_response:
+            engine_data = engine_response.json()
+            solution_type = engine_data.get("solutionType", "N/A")
+
+        typer.echo(f"\nFound {len(agents)} agent(s) in AgentSpace:\n")
+        typer.echo(f"Engine Solution Type: {solution_type}\n")
+        for i, agent in enumerate(agents, 1):
+            name = agent.get("name", "")
+            agent_id = name.split("/")[-1] if "/" in name else name
+            display_name = agent.get("displayName", "N/A")
+            description = agent.get("description", "N/A")
+
+            typer.echo(f"{i}. Agent ID: {agent_id}")
+            typer.echo(f"   Display Name: {display_name}")
+            typer.echo(f"   Description: {description}")
+
+            # Show tool description if available
+            adk_def = agent.get("adk_agent_definition", {})
+            tool_settings = adk_def.get("tool_settings", {})
+            if tool_settings.get("tool_description"):
+                typer.echo(f"   Tool Description: {tool_settings['tool_description']}")
+
+            # Show reasoning engine if available
+            prov_engine = adk_def.get("provisioned_reasoning_engine", {})
+            if prov_engine.get("reasoning_engine"):
+                typer.echo(f"   Reasoning Engine: {prov_engine['reasoning_engine']}")
 
-                typer.echo()
+            if show_raw:
+                typer.echo("\n   === RAW AGENT DATA ===")
+                typer.echo(json.dumps(agent, indent=4))
+                typer.echo("   === END AGENT DATA ===")
 
-            return True
+            typer.echo()
 
-        except requests.exceptions.RequestException as e:
-            typer.echo(f"Error listing agents: {e}", err=True)
-            if hasattr(e.response, "text"):
-                typer.echo(f"Response: {e.response.text}", err=True)
-            return False
+        return True
 
     def get_app_details(self, app_id: str) -> bool:
         """
@@ -1227,10 +1218,8 @@ class AgentSpaceManager:
                 typer.echo("  Common Config: Present")
 
             # Show raw JSON
-            import json as json_lib
-
             typer.echo("\n=== RAW JSON RESPONSE ===")
-            typer.echo(json_lib.dumps(result, indent=2))
+            typer.echo(json.dumps(result, indent=2))
             typer.echo("=== END RAW JSON ===\n")
 
             # Check if dataStoreIds field is present but empty vs not present